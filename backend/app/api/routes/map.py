@@ -1,14 +1,29 @@
 """
 Map API endpoints - Geographic data for map visualization.
 """
-from fastapi import APIRouter, Depends, Query
+import asyncio
+import hashlib
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from app.core.database import get_db
+import orjson
+
+from app.core.database import get_db, get_db_pool
 from app.services.map_service import MapService
 from app.services.geo_service import BoundingBox, calculate_distance
+from app.services.tile_cache import (
+    cached_fetch,
+    factoid_in_bounds,
+    get_last_ingest_ts,
+    overlay_in_bounds,
+    point_in_bounds,
+    route_in_bounds,
+)
 
 
 router = APIRouter()
@@ -80,11 +95,77 @@ class DistanceResult(BaseModel):
     difference_percent: float
 
 
+# ============================================
+# Helpers
+# ============================================
+
+@lru_cache(maxsize=256)
+def _split_csv(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a comma-separated filter param; memoized since values repeat."""
+    return tuple(value.split(",")) if value else None
+
+
+def _bounds_or_none(
+    sw_lng: Optional[float],
+    sw_lat: Optional[float],
+    ne_lng: Optional[float],
+    ne_lat: Optional[float],
+) -> Optional[BoundingBox]:
+    """Build a BoundingBox only when all four corners were given."""
+    if sw_lng is not None and sw_lat is not None and ne_lng is not None and ne_lat is not None:
+        return BoundingBox(sw_lng=sw_lng, sw_lat=sw_lat, ne_lng=ne_lng, ne_lat=ne_lat)
+    return None
+
+
+async def _not_modified(
+    request: Request,
+    response: Response,
+    max_age: int,
+) -> Optional[Response]:
+    """
+    Set Cache-Control and an ETag for the query params + last ingest time.
+
+    Returns a 304 response if the client's If-None-Match already matches,
+    otherwise None and the headers are attached to the real response.
+    Without a readable last-ingest time no ETag is sent (and no 304),
+    since it couldn't change when new data is ingested.
+    """
+    last_ingest_ts = await get_last_ingest_ts()
+    if last_ingest_ts is None:
+        response.headers["Cache-Control"] = f"public, max-age={max_age}"
+        return None
+
+    query = sorted(request.query_params.multi_items())
+    digest = hashlib.blake2b(f"{query}|{last_ingest_ts}".encode(), digest_size=8).hexdigest()
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate=600",
+        "ETag": f'"{digest}"',
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and headers["ETag"] in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+async def _with_service(pool, call):
+    """Run a MapService call on its own pooled connection."""
+    async with pool.acquire() as conn:
+        return await call(MapService(conn))
+
+
 # ============================================
 # Endpoints
 # ============================================
 
-@router.get("/factoids", response_model=List[MapFactoid])
+@router.get(
+    "/factoids",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[MapFactoid]}},
+)
 async def get_map_factoids(
     layers: Optional[str] = Query(None, description="Comma-separated layers: documented,attested,inferred"),
     categories: Optional[str] = Query(None, description="Comma-separated categories"),
@@ -104,32 +185,34 @@ async def get_map_factoids(
     - categories: Factoid types/categories
     - bounds: Geographic bounding box (sw_lng, sw_lat, ne_lng, ne_lat)
     - frame_id: Reference frame for retrieving date placements
+
+    Service output is returned as-is via orjson (schema documented via
+    MapFactoid) rather than re-validated per item.
     """
     service = MapService(db)
 
     # Parse comma-separated filters
-    layer_list = layers.split(",") if layers else None
-    category_list = categories.split(",") if categories else None
-
-    # Build bounds if provided
-    bounds = None
-    if all(v is not None for v in [sw_lng, sw_lat, ne_lng, ne_lat]):
-        bounds = BoundingBox(
-            sw_lng=sw_lng,
-            sw_lat=sw_lat,
-            ne_lng=ne_lng,
-            ne_lat=ne_lat,
-        )
-
-    factoids = await service.get_factoids_for_map(
-        layers=layer_list,
-        categories=category_list,
-        bounds=bounds,
-        frame_id=frame_id,
-        limit=limit,
+    layer_list = _split_csv(layers)
+    category_list = _split_csv(categories)
+
+    bounds = _bounds_or_none(sw_lng, sw_lat, ne_lng, ne_lat)
+
+    factoids = await cached_fetch(
+        "factoids",
+        bounds,
+        limit,
+        lambda tile_bounds: service.get_factoids_for_map(
+            layers=layer_list,
+            categories=category_list,
+            bounds=tile_bounds,
+            frame_id=frame_id,
+            limit=limit,
+        ),
+        factoid_in_bounds,
+        cacheable=not (layer_list or category_list or frame_id),
     )
 
-    return factoids
+    return ORJSONResponse(factoids)
 
 
 @router.get("/routes", response_model=List[JourneyRoute])
@@ -154,21 +237,21 @@ async def get_journey_routes(
     """
     service = MapService(db)
 
-    type_list = types.split(",") if types else None
-
-    bounds = None
-    if all(v is not None for v in [sw_lng, sw_lat, ne_lng, ne_lat]):
-        bounds = BoundingBox(
-            sw_lng=sw_lng,
-            sw_lat=sw_lat,
-            ne_lng=ne_lng,
-            ne_lat=ne_lat,
-        )
-
-    routes = await service.get_journey_routes(
-        route_types=type_list,
-        bounds=bounds,
-        limit=limit,
+    type_list = _split_csv(types)
+
+    bounds = _bounds_or_none(sw_lng, sw_lat, ne_lng, ne_lat)
+
+    routes = await cached_fetch(
+        "routes",
+        bounds,
+        limit,
+        lambda tile_bounds: service.get_journey_routes(
+            route_types=type_list,
+            bounds=tile_bounds,
+            limit=limit,
+        ),
+        route_in_bounds,
+        cacheable=not type_list,
     )
 
     return routes
@@ -181,27 +264,34 @@ async def get_historical_overlays(
     ne_lng: Optional[float] = Query(None),
     ne_lat: Optional[float] = Query(None),
     limit: int = Query(20, le=50),
-    db=Depends(get_db),
+    *,
+    request: Request,
+    response: Response,
+    pool=Depends(get_db_pool),
 ):
     """
     Get available historical map overlays.
 
     Returns georeferenced historical maps that can be overlaid on the modern map.
+    Overlays only change on ingest, so clients may cache them for an hour.
+    A connection is only taken from the pool on a cache miss, so 304s and
+    cache hits never wait on the database.
     """
-    service = MapService(db)
-
-    bounds = None
-    if all(v is not None for v in [sw_lng, sw_lat, ne_lng, ne_lat]):
-        bounds = BoundingBox(
-            sw_lng=sw_lng,
-            sw_lat=sw_lat,
-            ne_lng=ne_lng,
-            ne_lat=ne_lat,
-        )
-
-    overlays = await service.get_historical_overlays(
-        bounds=bounds,
-        limit=limit,
+    not_modified = await _not_modified(request, response, max_age=3600)
+    if not_modified:
+        return not_modified
+
+    bounds = _bounds_or_none(sw_lng, sw_lat, ne_lng, ne_lat)
+
+    overlays = await cached_fetch(
+        "overlays",
+        bounds,
+        limit,
+        lambda tile_bounds: _with_service(pool, lambda service: service.get_historical_overlays(
+            bounds=tile_bounds,
+            limit=limit,
+        )),
+        overlay_in_bounds,
     )
 
     return overlays
@@ -217,43 +307,69 @@ async def get_all_map_data(
     ne_lng: Optional[float] = Query(None),
     ne_lat: Optional[float] = Query(None),
     frame_id: Optional[UUID] = Query(None),
-    db=Depends(get_db),
+    *,
+    request: Request,
+    response: Response,
+    pool=Depends(get_db_pool),
 ):
     """
     Get all map data in a single request.
 
     Combines factoids, routes, and overlays for efficient loading.
+    Repeat requests with a matching ETag get a 304 without touching the database.
     """
-    service = MapService(db)
-
-    layer_list = layers.split(",") if layers else None
-    category_list = categories.split(",") if categories else None
-    route_type_list = route_types.split(",") if route_types else None
-
-    bounds = None
-    if all(v is not None for v in [sw_lng, sw_lat, ne_lng, ne_lat]):
-        bounds = BoundingBox(
-            sw_lng=sw_lng,
-            sw_lat=sw_lat,
-            ne_lng=ne_lng,
-            ne_lat=ne_lat,
-        )
-
-    # Fetch all data
-    factoids = await service.get_factoids_for_map(
-        layers=layer_list,
-        categories=category_list,
-        bounds=bounds,
-        frame_id=frame_id,
-    )
-
-    routes = await service.get_journey_routes(
-        route_types=route_type_list,
-        bounds=bounds,
+    not_modified = await _not_modified(request, response, max_age=60)
+    if not_modified:
+        return not_modified
+
+    layer_list = _split_csv(layers)
+    category_list = _split_csv(categories)
+    route_type_list = _split_csv(route_types)
+
+    bounds = _bounds_or_none(sw_lng, sw_lat, ne_lng, ne_lat)
+
+    # Fetch all data concurrently - the three queries are independent.
+    # A connection runs one query at a time, so each gets its own.
+    # Cache keys match the per-layer endpoints at their default limits.
+    factoids, routes, overlays = await asyncio.gather(
+        cached_fetch(
+            "factoids",
+            bounds,
+            500,
+            lambda tile_bounds: _with_service(pool, lambda service: service.get_factoids_for_map(
+                layers=layer_list,
+                categories=category_list,
+                bounds=tile_bounds,
+                frame_id=frame_id,
+                limit=500,
+            )),
+            factoid_in_bounds,
+            cacheable=not (layer_list or category_list or frame_id),
+        ),
+        cached_fetch(
+            "routes",
+            bounds,
+            100,
+            lambda tile_bounds: _with_service(pool, lambda service: service.get_journey_routes(
+                route_types=route_type_list,
+                bounds=tile_bounds,
+                limit=100,
+            )),
+            route_in_bounds,
+            cacheable=not route_type_list,
+        ),
+        cached_fetch(
+            "overlays",
+            bounds,
+            20,
+            lambda tile_bounds: _with_service(pool, lambda service: service.get_historical_overlays(
+                bounds=tile_bounds,
+                limit=20,
+            )),
+            overlay_in_bounds,
+        ),
     )
 
-    overlays = await service.get_historical_overlays(bounds=bounds)
-
     return MapDataResponse(
         factoids=factoids,
         routes=routes,
@@ -328,6 +444,15 @@ async def calculate_distance_between_points(
     Returns spherical (Haversine) and flat (Euclidean) distances
     for comparison and transparency.
     """
+    # Same point (e.g. frontend tooltips on a single marker): skip the trig
+    if lng1 == lng2 and lat1 == lat2:
+        return DistanceResult(
+            spherical_km=0.0,
+            flat_km=0.0,
+            difference_km=0.0,
+            difference_percent=0.0,
+        )
+
     spherical = calculate_distance(lng1, lat1, lng2, lat2, model="spherical")
     flat = calculate_distance(lng1, lat1, lng2, lat2, model="flat")
 
@@ -354,7 +479,12 @@ class BulkLocation(BaseModel):
     type: Optional[str] = None
 
 
-@router.get("/locations", response_model=List[BulkLocation])
+@router.get(
+    "/locations",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[BulkLocation]}},
+)
 async def get_bulk_locations(
     types: Optional[str] = Query(None, description="Comma-separated location types"),
     sw_lng: Optional[float] = Query(None),
@@ -362,31 +492,53 @@ async def get_bulk_locations(
     ne_lng: Optional[float] = Query(None),
     ne_lat: Optional[float] = Query(None),
     limit: int = Query(50000, le=100000, description="Max locations to return"),
-    db=Depends(get_db),
+    *,
+    request: Request,
+    pool=Depends(get_db_pool),
 ):
     """
     Get all locations for bulk map rendering (cluster layer).
 
     Returns simplified location data optimized for WebGL rendering.
-    Can handle 100k+ locations efficiently.
-    """
-    service = MapService(db)
+    Can handle 100k+ locations efficiently: rows are serialized with orjson
+    directly, skipping per-item Pydantic validation (schema documented via
+    BulkLocation).
 
-    type_list = types.split(",") if types else None
-
-    bounds = None
-    if all(v is not None for v in [sw_lng, sw_lat, ne_lng, ne_lat]):
-        bounds = BoundingBox(
-            sw_lng=sw_lng,
-            sw_lat=sw_lat,
-            ne_lng=ne_lng,
-            ne_lat=ne_lat,
-        )
-
-    locations = await service.get_bulk_locations(
-        location_types=type_list,
-        bounds=bounds,
-        limit=limit,
+    Clients sending `Accept: application/x-ndjson` get one location per line,
+    streamed from a database cursor as rows arrive, so rendering can start
+    before the whole result is fetched. Streamed responses skip the tile cache.
+    """
+    type_list = _split_csv(types)
+
+    bounds = _bounds_or_none(sw_lng, sw_lat, ne_lng, ne_lat)
+
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        async def stream_lines():
+            async with pool.acquire() as conn:
+                batches = MapService(conn).stream_bulk_locations(
+                    location_types=type_list,
+                    bounds=bounds,
+                    limit=limit,
+                )
+                async for batch in batches:
+                    yield b"".join(
+                        orjson.dumps(location, option=orjson.OPT_APPEND_NEWLINE)
+                        for location in batch
+                    )
+
+        return StreamingResponse(stream_lines(), media_type="application/x-ndjson")
+
+    locations = await cached_fetch(
+        "locations",
+        bounds,
+        limit,
+        lambda tile_bounds: _with_service(pool, lambda service: service.get_bulk_locations(
+            location_types=type_list,
+            bounds=tile_bounds,
+            limit=limit,
+        )),
+        point_in_bounds,
+        cacheable=not type_list,
     )
 
-    return locations
+    return ORJSONResponse(locations)
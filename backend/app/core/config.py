@@ -17,9 +17,20 @@ class Settings(BaseSettings):
     SUPABASE_SERVICE_KEY: str = ""
     SUPABASE_JWT_SECRET: str = ""
     DATABASE_URL: str = ""
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+
+    # Ingest: id of the default reference frame; looked up once per
+    # process when unset
+    DEFAULT_FRAME_ID: str = ""
+    INGEST_DB_POOL_MIN_SIZE: int = 4
+    INGEST_DB_POOL_MAX_SIZE: int = 32
+    INGEST_DB_COMMAND_TIMEOUT: float = 60.0
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 16
 
     # Security
     SECRET_KEY: str = "change-me-in-production"
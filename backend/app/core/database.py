@@ -1,10 +1,17 @@
 """
-Supabase client for backend database operations.
-Uses service key for full access (bypasses RLS).
+Database access for the backend.
+
+- API routes use a pooled asyncpg connection (see db_pool.py).
+- The Supabase client is kept for admin/auth paths; it uses the service
+  key for full access (bypasses RLS).
 """
+from typing import AsyncIterator
+
+import asyncpg
 from supabase import create_client, Client
 from functools import lru_cache
 from app.core.config import settings
+from app.core.db_pool import get_pool
 
 
 @lru_cache()
@@ -24,6 +31,12 @@ def get_supabase_client() -> Client:
     )
 
 
-def get_db() -> Client:
-    """Dependency for FastAPI routes."""
-    return get_supabase_client()
+async def get_db() -> AsyncIterator[asyncpg.Connection]:
+    """Dependency for FastAPI routes - one pooled connection per request."""
+    async with get_pool().acquire() as conn:
+        yield conn
+
+
+def get_db_pool() -> asyncpg.Pool:
+    """Dependency for routes that need several connections concurrently."""
+    return get_pool()
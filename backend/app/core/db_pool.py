@@ -0,0 +1,83 @@
+"""
+asyncpg connection pool for API request handlers.
+
+Talks directly to PostgreSQL via DATABASE_URL instead of going through
+the Supabase REST (PostgREST) layer, so map queries don't block the
+event loop or pay an HTTP+JSON round trip per query.
+
+asyncpg prepares every query on first use and keeps it in a per-connection
+statement cache keyed by SQL text, so repeated map queries skip the
+parse/plan step. Services keep their SQL text stable (parameters only, no
+inlined values) so each query shape maps to one cached statement.
+"""
+import asyncpg
+import orjson
+
+from app.core.config import settings
+
+_pool: asyncpg.Pool | None = None
+
+# Binary jsonb is a version byte followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _jsonb_encode(value) -> bytes:
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _jsonb_decode(data: bytes):
+    return orjson.loads(data[1:])
+
+
+async def set_json_codecs(conn: asyncpg.Connection) -> None:
+    """
+    Map json/jsonb columns to Python objects via orjson.
+
+    Uses the binary wire format, so values go straight between orjson and
+    the socket without an intermediate str.
+    """
+    await conn.set_type_codec(
+        "json", encoder=orjson.dumps, decoder=orjson.loads,
+        schema="pg_catalog", format="binary",
+    )
+    await conn.set_type_codec(
+        "jsonb", encoder=_jsonb_encode, decoder=_jsonb_decode,
+        schema="pg_catalog", format="binary",
+    )
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns into Python objects."""
+    await set_json_codecs(conn)
+
+
+async def init_pool() -> None:
+    """Create the process-wide connection pool. Called on app startup."""
+    global _pool
+    if not settings.DATABASE_URL:
+        raise RuntimeError("DATABASE_URL must be set in environment")
+
+    _pool = await asyncpg.create_pool(
+        settings.DATABASE_URL,
+        min_size=settings.DB_POOL_MIN_SIZE,
+        max_size=settings.DB_POOL_MAX_SIZE,
+        max_inactive_connection_lifetime=300,
+        command_timeout=30,
+        statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+        init=_init_connection,
+    )
+
+
+async def close_pool() -> None:
+    """Close the connection pool. Called on app shutdown."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+def get_pool() -> asyncpg.Pool:
+    """Return the connection pool, failing loudly if startup didn't run."""
+    if _pool is None:
+        raise RuntimeError("Database pool not initialized")
+    return _pool
@@ -0,0 +1,25 @@
+"""
+Shared async Redis client for API request handlers.
+
+One connection pool per process, reused across requests instead of
+opening a new TCP connection per call.
+"""
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+_redis_pool = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+)
+_redis = redis.Redis(connection_pool=_redis_pool)
+
+
+def get_redis() -> redis.Redis:
+    """Return the process-wide pooled Redis client."""
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the Redis client and release pooled connections."""
+    await _redis.aclose()
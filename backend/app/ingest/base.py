@@ -9,63 +9,383 @@ All ingestors follow the HistoryBuff data model:
 - factoid_placements: Temporal placement in reference frames
 - connections: Relationships between entities
 
-Uses Supabase REST API (not direct PostgreSQL) for reliable connectivity.
+Buffered rows are bulk-loaded straight into PostgreSQL with COPY over an
+asyncpg pool. The Supabase REST API is only used for the one-time
+default reference frame lookup.
 """
 
-import json
+import asyncio
+import csv
+import io
 import logging
+import re
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import Any
-from uuid import UUID
-
+from dataclasses import asdict, dataclass, fields, is_dataclass, replace
+from functools import lru_cache
+from operator import attrgetter
+from datetime import date, datetime, timezone
+from typing import Any, Callable, ClassVar
+from uuid import UUID, uuid4
+
+import asyncpg
+import orjson
 from supabase import create_client, Client
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from app.core.config import settings
+from app.core.db_pool import set_json_codecs
+from app.services import tile_cache
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    # Time-ordered ids keep new rows at the right edge of the primary key
+    # index instead of scattering inserts across it
+    from uuid_utils import uuid7 as _new_uuid
+except ImportError:
+    _new_uuid = uuid4
+
+# Rows per bulk COPY
+BATCH_SIZE = 1000
+
+# Seconds allowed per index rebuild after a bulk load (well past the
+# pool's command timeout; see rebuild_indexes)
+INDEX_BUILD_TIMEOUT = 3600.0
+
+# Plain btree indexes that API queries read through (connection lookups,
+# placements by frame and date, a factoid's placements and sources, a
+# source's factoids). drop_secondary_indexes() leaves them in place so
+# those endpoints don't fall back to sequential scans during a load.
+READ_PATH_INDEXES = (
+    "idx_connections_from",
+    "idx_connections_to",
+    "idx_placements_frame_date",
+    "idx_placements_factoid",
+    "idx_factoid_sources_factoid",
+    "idx_factoid_sources_source",
+)
+
+# Buffered tables in flush order: parents before children so foreign
+# keys to rows from the same batch resolve.
+FLUSH_ORDER = (
+    "locations",
+    "actors",
+    "sources",
+    "factoids",
+    "factoid_placements",
+    "factoid_sources",
+    "connections",
+)
+
+# Tables loaded with a prepared INSERT ... ON CONFLICT DO NOTHING instead
+# of COPY, and their conflict key
+UPSERT_CONFLICT = {
+    "factoid_sources": ("factoid_id", "source_id"),
+}
+
+# Tables whose rows go through binary COPY as-is: no JSON columns, and
+# dates (including BCE strings) are encoded by _pg_date_encode. Factoids
+# are all text, so the wide factoid rows skip server-side CSV parsing too.
+BINARY_COPY_TABLES = frozenset({"factoids", "factoid_placements", "connections"})
+
+# Columns referencing other ingested rows, remapped through _id_aliases
+# when the referenced row turned out to exist already
+FK_COLUMNS = {
+    "sources": ("author_id",),
+    "factoid_placements": ("factoid_id",),
+    "factoid_sources": ("factoid_id", "source_id"),
+    "connections": ("from_entity_id", "to_entity_id"),
+}
+
+# Buffered tables whose rows may already exist in the database: matches
+# between a staged row `s` and an existing row `t`, each probed separately
+# (in order) so every one can use its own index, and the stat counting
+# the rows dropped as duplicates (see _copy_new_rows)
+DEDUP_MATCH = {
+    "locations": (("t.external_id = s.external_id AND t.deleted_at IS NULL",), "locations_skipped"),
+    "actors": (("t.name_primary = s.name_primary AND t.deleted_at IS NULL",), "actors_skipped"),
+    "sources": (
+        (
+            # idx_sources_digital_url_unique
+            "t.digital_url = s.digital_url",
+            # idx_sources_title_author, for sources without a URL
+            "s.digital_url IS NULL AND t.title = s.title AND t.author_id = s.author_id",
+            "s.digital_url IS NULL AND s.author_id IS NULL"
+            " AND t.title = s.title AND t.author_id IS NULL",
+        ),
+        "sources_skipped",
+    ),
+}
+
+# Errors that roll back a whole flush rather than one batch: the connection
+# is gone, or the transaction lost a serialization race or deadlock. The
+# flush is retried up to WRITE_RETRY_ATTEMPTS times, then the error fails
+# the ingest instead of being logged like a bad batch.
+RETRYABLE_WRITE_ERRORS = (
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+    asyncpg.SerializationError,
+    asyncpg.DeadlockDetectedError,
+    OSError,
+)
+WRITE_RETRY_ATTEMPTS = 4
+WRITE_RETRY_MAX_WAIT = 10.0
+
+# IngestStats counter bumped by the number of rows written per table
+CREATED_STATS = {
+    "locations": "locations_created",
+    "actors": "actors_created",
+    "sources": "sources_created",
+    "factoids": "factoids_created",
+    "factoid_placements": "placements_created",
+    "connections": "connections_created",
+}
+
+
+@dataclass(slots=True)
+class IngestStats:
+    """Counters for one ingest run."""
+    sources_created: int = 0
+    sources_skipped: int = 0
+    factoids_created: int = 0
+    factoids_skipped: int = 0
+    placements_created: int = 0
+    locations_created: int = 0
+    locations_skipped: int = 0
+    actors_created: int = 0
+    actors_skipped: int = 0
+    connections_created: int = 0
+    errors: int = 0
+
+
+# Fixed-schema rows for the high-volume child tables. Unlike the dict rows
+# of the other tables they carry every column (None is NULL, matching those
+# columns' defaults), so a batch is one column set and COPY records come
+# straight from the fields. `id` is assigned by _buffer_row().
+@dataclass(slots=True)
+class PlacementRow:
+    """A factoid_placements row."""
+    factoid_id: str
+    frame_id: str
+    date_precision: str
+    placement_confidence: float
+    placement_type: str
+    # date objects and BCE strings both COPY as-is (see _pg_date_encode)
+    date_start: date | str | None = None
+    date_end: date | str | None = None
+    reasoning: str | None = None
+    id: str = ""
+
+
+@dataclass(slots=True)
+class FactoidSourceRow:
+    """A factoid_sources row."""
+    factoid_id: str
+    source_id: str
+    relationship: str
+    relevant_excerpt: str | None = None
+    id: str = ""
+
+
+@dataclass(slots=True)
+class ConnectionRow:
+    """A connections row."""
+    from_entity_type: str
+    from_entity_id: str
+    to_entity_type: str
+    to_entity_id: str
+    connection_type: str
+    confidence: float
+    notes: str | None = None
+    id: str = ""
+
+
+Row = dict | PlacementRow | FactoidSourceRow | ConnectionRow
+
+
+@lru_cache(maxsize=None)
+def _row_layout(row_type: type) -> tuple[tuple[str, ...], Callable]:
+    """Columns, and a getter returning them as a tuple."""
+    columns = tuple(f.name for f in fields(row_type))
+    return columns, attrgetter(*columns)
+
+
+@lru_cache(maxsize=32)
+def _upsert_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build the INSERT ... ON CONFLICT DO NOTHING for one column set."""
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({', '.join(UPSERT_CONFLICT[table])}) DO NOTHING"
+    )
+
+
+def _clean(data: dict) -> dict:
+    """Drop None values so omitted columns take their DB default."""
+    return {k: v for k, v in data.items() if v is not None}
+
+
+# PostgreSQL's binary date is a day count from 2000-01-01 (proleptic
+# Gregorian). Python dates stop at year 1, so earlier years are shifted by
+# whole 400-year Gregorian cycles, which have a fixed length.
+_PG_EPOCH_ORDINAL = date(2000, 1, 1).toordinal()
+_GREGORIAN_CYCLE_DAYS = 146097
+_DATE_STRING = re.compile(r"(-)?(\d+)-(\d\d)-(\d\d)( BC)?")
+
+
+def _pg_date_encode(value: date | str) -> tuple[int]:
+    """
+    Encode a date, or an ISO date string, for asyncpg's binary date codec.
+
+    Strings may be BCE either PostgreSQL-style ("0585-05-28 BC") or as an
+    astronomical year ("-0584-05-28", year 0 = 1 BC), as ingestors pass them.
+    """
+    if isinstance(value, date):
+        return (value.toordinal() - _PG_EPOCH_ORDINAL,)
+
+    match = _DATE_STRING.fullmatch(value.strip())
+    if not match or (match[1] and match[5]):
+        raise ValueError(f"Unsupported date: {value!r}")
+    year = int(match[2])
+    if match[1]:
+        year = -year
+    elif match[5]:
+        year = 1 - year
+
+    cycles = max(0, (400 - year) // 400)
+    ordinal = date(year + 400 * cycles, int(match[3]), int(match[4])).toordinal()
+    return (ordinal - _GREGORIAN_CYCLE_DAYS * cycles - _PG_EPOCH_ORDINAL,)
+
+
+def _pg_date_decode(value: tuple[int]) -> date | str:
+    """Decode a binary date; BCE dates come back as "YYYY-MM-DD BC" strings."""
+    ordinal = value[0] + _PG_EPOCH_ORDINAL
+    if ordinal >= 1:
+        return date.fromordinal(ordinal)
+    cycles = -ordinal // _GREGORIAN_CYCLE_DAYS + 1
+    shifted = date.fromordinal(ordinal + _GREGORIAN_CYCLE_DAYS * cycles)
+    year = shifted.year - 400 * cycles
+    return f"{1 - year:04d}-{shifted.month:02d}-{shifted.day:02d} BC"
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Let binary COPY and query parameters take BCE date strings, and
+    JSON parameters take Python objects (orjson-encoded).
+    """
+    await set_json_codecs(conn)
+    await conn.set_type_codec(
+        "date",
+        schema="pg_catalog",
+        encoder=_pg_date_encode,
+        decoder=_pg_date_decode,
+        format="tuple",
+    )
+
+
+def _copy_value(value: Any) -> Any:
+    """Render a row value for CSV COPY; JSON columns are serialized."""
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode()
+    return value
+
+
+def _csv_source(records: list[list]) -> io.BytesIO:
+    """Encode records as CSV for COPY ... FROM STDIN."""
+    buf = io.StringIO()
+    # Quote everything so empty strings stay distinct from NULL
+    csv.writer(buf, quoting=csv.QUOTE_ALL).writerows(records)
+    return io.BytesIO(buf.getvalue().encode("utf-8"))
+
 
 class BaseIngestor(ABC):
     """Base class for all data ingestors."""
 
+    # Shared by every ingestor in the process (one client, one frame lookup)
+    _shared_supabase: ClassVar[Client | None] = None
+    _shared_default_frame_id: ClassVar[str | None] = settings.DEFAULT_FRAME_ID or None
+    _default_frame_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
     def __init__(self, data_dir: str = "./data"):
         self.data_dir = data_dir
         self.supabase: Client | None = None
+        self.pool: asyncpg.Pool | None = None
         self.default_frame_id: str | None = None
-        self.stats = {
-            "sources_created": 0,
-            "sources_skipped": 0,
-            "factoids_created": 0,
-            "factoids_skipped": 0,
-            "placements_created": 0,
-            "locations_created": 0,
-            "locations_skipped": 0,
-            "actors_created": 0,
-            "actors_skipped": 0,
-            "connections_created": 0,
-            "errors": 0,
-        }
+        self.stats = IngestStats()
+        # Rows waiting to be written, per table (see flush())
+        self._buffers: dict[str, list[Row]] = {table: [] for table in FLUSH_ORDER}
+        # Full buffers being written while parsing carries on (at most one)
+        self._write_task: asyncio.Task | None = None
+        # (table, dedup key...) -> id for rows created or found in this run;
+        # repeats skip the database entirely (and see buffered rows, which
+        # existence SELECTs can't)
+        self._id_cache: dict[tuple, str] = {}
+        # Client id of a buffered row -> id of the existing row it duplicated
+        self._id_aliases: dict[str, str] = {}
 
     async def connect(self) -> None:
-        """Establish Supabase connection."""
-        self.supabase = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_SERVICE_KEY,  # Use service key for full access
+        """Establish Supabase and direct PostgreSQL connections."""
+        if not settings.DATABASE_URL:
+            raise RuntimeError("DATABASE_URL must be set for bulk ingest")
+        # Connections live for the whole run (no idle expiry), so the
+        # statements asyncpg prepares for each batch shape stay cached on them
+        self.pool = await asyncpg.create_pool(
+            settings.DATABASE_URL,
+            min_size=settings.INGEST_DB_POOL_MIN_SIZE,
+            max_size=settings.INGEST_DB_POOL_MAX_SIZE,
+            command_timeout=settings.INGEST_DB_COMMAND_TIMEOUT,
+            max_inactive_connection_lifetime=0,
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            init=_init_connection,
         )
-        logger.info("Supabase connection established")
 
-        # Get default reference frame
-        result = self.supabase.table("reference_frames").select("id").eq("is_default", True).limit(1).execute()
-        if result.data:
-            self.default_frame_id = result.data[0]["id"]
-            logger.info(f"Using default frame: {self.default_frame_id}")
-        else:
-            logger.warning("No default reference frame found!")
+        if BaseIngestor._shared_supabase is None:
+            BaseIngestor._shared_supabase = create_client(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_SERVICE_KEY,  # Use service key for full access
+            )
+            logger.info("Supabase connection established")
+        self.supabase = BaseIngestor._shared_supabase
+
+        self.default_frame_id = await self._get_default_frame_id()
+
+    async def _get_default_frame_id(self) -> str | None:
+        """
+        Default reference frame id: settings.DEFAULT_FRAME_ID, else looked up
+        once per process (ingestors connecting concurrently share the lookup).
+        """
+        if BaseIngestor._shared_default_frame_id is None:
+            async with BaseIngestor._default_frame_lock:
+                if BaseIngestor._shared_default_frame_id is None:
+                    # (supabase-py blocks; keep the event loop free)
+                    result = await asyncio.to_thread(
+                        self.supabase.table("reference_frames").select("id").eq("is_default", True).limit(1).execute
+                    )
+                    if result.data:
+                        BaseIngestor._shared_default_frame_id = result.data[0]["id"]
+                        logger.info(f"Using default frame: {result.data[0]['id']}")
+                    else:
+                        logger.warning("No default reference frame found!")
+        return BaseIngestor._shared_default_frame_id
 
     async def close(self) -> None:
-        """Close connection (no-op for REST API)."""
-        logger.info("Supabase connection closed")
+        """Write any buffered rows and close the database pool."""
+        if self.pool:
+            await self.flush()
+            await self.pool.close()
+            self.pool = None
+        logger.info("Database connections closed")
 
     @abstractmethod
     async def ingest(self) -> dict[str, Any]:
@@ -105,7 +425,7 @@ class BaseIngestor(ABC):
         Args:
             name_modern: Current name of the location
             name_historical: List of historical names. Can be:
-                - Simple strings: ["Rome", "pleiades:123"]
+                - Simple strings: ["Rome", "Roma"]
                 - Structured objects: [{"name": "Byzantium", "period_start": "-0667", "period_end": "0330"}]
             location_type: point, area, or linear
             location_subtype: More specific classification
@@ -119,7 +439,8 @@ class BaseIngestor(ABC):
             terrain_notes: Terrain description
             elevation_m: Elevation in meters
             description: General description
-            external_id: External identifier for deduplication
+            external_id: External identifier for deduplication (stored in
+                the external_id column only, never among the names)
 
         Returns:
             Location UUID as string, or None if skipped.
@@ -128,15 +449,20 @@ class BaseIngestor(ABC):
             raise RuntimeError("Supabase not connected")
 
         if not name_modern and not name_historical:
-            self.stats["locations_skipped"] += 1
+            self.stats.locations_skipped += 1
             return None
 
-        # Prepare historical names - ensure it's a list
-        hist_names = name_historical or []
+        # Prepare historical names - ensure it's a list (a fresh one, so the
+        # caller's list is never shared or mutated)
+        hist_names = list(name_historical or ())
 
-        # Note: Deduplication by external_id in JSONB arrays is complex via REST API.
-        # For MVP, we skip the check and rely on the database handling duplicates.
-        # Future: Add a dedicated external_id column for efficient deduplication.
+        # Repeats within a run reuse the first row via the id cache; rows that
+        # already exist in the database are dropped at flush time by matching
+        # external_id (see _copy_new_rows).
+        cache_key = ("locations", external_id)
+        if external_id and cache_key in self._id_cache:
+            self.stats.locations_skipped += 1
+            return self._id_cache[cache_key]
 
         # Insert new location
         data = {
@@ -154,15 +480,11 @@ class BaseIngestor(ABC):
             "terrain_notes": terrain_notes,
             "elevation_m": elevation_m,
             "description": description,
+            "external_id": external_id,
         }
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        data = _clean(data)
 
-        result = self.supabase.table("locations").insert(data).execute()
-        if result.data:
-            self.stats["locations_created"] += 1
-            return result.data[0]["id"]
-        return None
+        return await self._buffer_row("locations", data, [cache_key] if external_id else [])
 
     # ==========================================
     # ACTORS
@@ -189,27 +511,22 @@ class BaseIngestor(ABC):
             raise RuntimeError("Supabase not connected")
 
         if not name_primary or len(name_primary) < 2:
-            self.stats["actors_skipped"] += 1
+            self.stats.actors_skipped += 1
             return None
 
-        # Prepare aliases
-        aliases = name_aliases or []
+        cache_keys = [("actors", name_primary)]
+        if external_id:
+            cache_keys.append(("actors", external_id))
+        actor_id = self._cached_id(cache_keys)
+        if actor_id:
+            self.stats.actors_skipped += 1
+            return actor_id
+
+        # Prepare aliases (a fresh list, so the caller's list is never mutated)
+        aliases = list(name_aliases or ())
         if external_id and external_id not in aliases:
             aliases.append(external_id)
 
-        # Check for existing by external_id in aliases
-        if external_id:
-            result = self.supabase.table("actors").select("id").contains("name_aliases", [external_id]).limit(1).execute()
-            if result.data:
-                self.stats["actors_skipped"] += 1
-                return result.data[0]["id"]
-
-        # Check by name
-        result = self.supabase.table("actors").select("id").eq("name_primary", name_primary).limit(1).execute()
-        if result.data:
-            self.stats["actors_skipped"] += 1
-            return result.data[0]["id"]
-
         # Insert new actor
         data = {
             "name_primary": name_primary,
@@ -220,14 +537,12 @@ class BaseIngestor(ABC):
             "description": description,
             "known_biases": known_biases,
         }
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        data = _clean(data)
 
-        result = self.supabase.table("actors").insert(data).execute()
-        if result.data:
-            self.stats["actors_created"] += 1
-            return result.data[0]["id"]
-        return None
+        # Deduped against the database by name at flush time (see
+        # _copy_new_rows); sources buffered with this id as author_id are
+        # pointed at an existing actor there too
+        return await self._buffer_row("actors", data, cache_keys)
 
     # ==========================================
     # SOURCES
@@ -242,6 +557,7 @@ class BaseIngestor(ABC):
         raw_dating_evidence: str | None = None,
         raw_period_covered: str | None = None,
         original_language: str | None = None,
+        edition_notes: str | None = None,
         digital_url: str | None = None,
         external_id: str | None = None,
     ) -> str | None:
@@ -255,26 +571,16 @@ class BaseIngestor(ABC):
             raise RuntimeError("Supabase not connected")
 
         if not title:
-            self.stats["sources_skipped"] += 1
+            self.stats.sources_skipped += 1
             return None
 
-        # Check for existing by URL (if provided)
-        if digital_url:
-            result = self.supabase.table("sources").select("id").eq("digital_url", digital_url).limit(1).execute()
-            if result.data:
-                self.stats["sources_skipped"] += 1
-                return result.data[0]["id"]
-
-        # Check by title + author
-        query = self.supabase.table("sources").select("id").eq("title", title)
-        if author_id:
-            query = query.eq("author_id", author_id)
-        else:
-            query = query.is_("author_id", "null")
-        result = query.limit(1).execute()
-        if result.data:
-            self.stats["sources_skipped"] += 1
-            return result.data[0]["id"]
+        cache_keys = [("sources", digital_url) if digital_url else ("sources", title, author_id)]
+        if external_id:
+            cache_keys.append(("sources", external_id))
+        source_id = self._cached_id(cache_keys)
+        if source_id:
+            self.stats.sources_skipped += 1
+            return source_id
 
         # Insert new source
         data = {
@@ -285,17 +591,16 @@ class BaseIngestor(ABC):
             "raw_dating_evidence": raw_dating_evidence,
             "raw_period_covered": raw_period_covered,
             "original_language": original_language,
+            "edition_notes": edition_notes,
             "digital_url": digital_url,
             "extraction_status": "pending",
         }
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        data = _clean(data)
 
-        result = self.supabase.table("sources").insert(data).execute()
-        if result.data:
-            self.stats["sources_created"] += 1
-            return result.data[0]["id"]
-        return None
+        # Deduped against the database at flush time, by URL or else by
+        # title + author (see _copy_new_rows), so whole batches of sources
+        # cost a single round trip
+        return await self._buffer_row("sources", data, cache_keys)
 
     # ==========================================
     # FACTOIDS
@@ -321,7 +626,7 @@ class BaseIngestor(ABC):
             raise RuntimeError("Supabase not connected")
 
         if not description or len(description) < 10:
-            self.stats["factoids_skipped"] += 1
+            self.stats.factoids_skipped += 1
             return None
 
         # Insert new factoid
@@ -334,14 +639,9 @@ class BaseIngestor(ABC):
             "raw_observation_type": raw_observation_type,
             "status": status,
         }
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        data = _clean(data)
 
-        result = self.supabase.table("factoids").insert(data).execute()
-        if result.data:
-            self.stats["factoids_created"] += 1
-            return result.data[0]["id"]
-        return None
+        return await self._buffer_row("factoids", data)
 
     # ==========================================
     # FACTOID PLACEMENTS
@@ -376,33 +676,19 @@ class BaseIngestor(ABC):
             logger.warning("No frame_id and no default frame - skipping placement")
             return None
 
-        # Handle date conversion - support both date objects and strings
-        def format_date(d):
-            if d is None:
-                return None
-            if isinstance(d, str):
-                return d  # Already a string (for BCE dates)
-            return d.isoformat()
-
         # Insert new placement
-        data = {
-            "factoid_id": factoid_id,
-            "frame_id": frame_id,
-            "date_start": format_date(date_start),
-            "date_end": format_date(date_end),
-            "date_precision": date_precision,
-            "placement_confidence": placement_confidence,
-            "reasoning": reasoning,
-            "placement_type": placement_type,
-        }
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        row = PlacementRow(
+            factoid_id=factoid_id,
+            frame_id=frame_id,
+            date_precision=date_precision,
+            placement_confidence=placement_confidence,
+            placement_type=placement_type,
+            date_start=date_start,
+            date_end=date_end,
+            reasoning=reasoning,
+        )
 
-        result = self.supabase.table("factoid_placements").insert(data).execute()
-        if result.data:
-            self.stats["placements_created"] += 1
-            return result.data[0]["id"]
-        return None
+        return await self._buffer_row("factoid_placements", row)
 
     # ==========================================
     # FACTOID-SOURCE LINKS
@@ -419,17 +705,15 @@ class BaseIngestor(ABC):
         if not self.supabase:
             raise RuntimeError("Supabase not connected")
 
-        data = {
-            "factoid_id": factoid_id,
-            "source_id": source_id,
-            "relationship": relationship,
-            "relevant_excerpt": relevant_excerpt,
-        }
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        row = FactoidSourceRow(
+            factoid_id=factoid_id,
+            source_id=source_id,
+            relationship=relationship,
+            relevant_excerpt=relevant_excerpt,
+        )
 
-        # Use upsert to avoid duplicates
-        self.supabase.table("factoid_sources").upsert(data, on_conflict="factoid_id,source_id").execute()
+        # Written with upsert to avoid duplicates (see UPSERT_CONFLICT)
+        await self._buffer_row("factoid_sources", row)
 
     # ==========================================
     # CONNECTIONS
@@ -449,24 +733,376 @@ class BaseIngestor(ABC):
         if not self.supabase:
             raise RuntimeError("Supabase not connected")
 
-        data = {
-            "from_entity_type": from_entity_type,
-            "from_entity_id": from_entity_id,
-            "to_entity_type": to_entity_type,
-            "to_entity_id": to_entity_id,
-            "connection_type": connection_type,
-            "confidence": confidence,
-            "notes": notes,
-        }
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        row = ConnectionRow(
+            from_entity_type=from_entity_type,
+            from_entity_id=from_entity_id,
+            to_entity_type=to_entity_type,
+            to_entity_id=to_entity_id,
+            connection_type=connection_type,
+            confidence=confidence,
+            notes=notes,
+        )
+
+        return await self._buffer_row("connections", row)
+
+    # ==========================================
+    # BATCHED WRITES
+    # ==========================================
 
-        result = self.supabase.table("connections").insert(data).execute()
-        if result.data:
-            self.stats["connections_created"] += 1
-            return result.data[0]["id"]
+    async def _buffer_row(self, table: str, data: Row, cache_keys: list[tuple] = ()) -> str:
+        """
+        Queue a row for bulk insert and return its (client-generated) id.
+
+        Ids are assigned here so callers can reference the row, e.g. as a
+        foreign key, before it is written. The id is cached under cache_keys
+        before any await, so concurrent callers creating the same row see it.
+        Once any buffer is full, all of them are handed to a background
+        write together, so parents always land before children while the
+        caller keeps producing rows.
+        """
+        row_id = str(_new_uuid())
+        if isinstance(data, dict):
+            data["id"] = row_id
+        else:
+            data.id = row_id
+        for key in cache_keys:
+            self._id_cache[key] = row_id
+        buffer = self._buffers[table]
+        buffer.append(data)
+        if len(buffer) >= BATCH_SIZE:
+            # One write in flight at a time: wait for the previous one, which
+            # also bounds memory to two batches per table
+            await self._wait_for_write()
+            # (unless a concurrent caller handed the buffers off meanwhile)
+            if len(self._buffers[table]) >= BATCH_SIZE:
+                self._start_write()
+        return row_id
+
+    async def flush(self) -> None:
+        """Write all buffered rows, one COPY per table (and column set)."""
+        await self._wait_for_write()
+        self._start_write()
+        await self._wait_for_write()
+
+    def _start_write(self) -> None:
+        """Hand the current buffers to a background write."""
+        buffers = self._buffers
+        self._buffers = {table: [] for table in FLUSH_ORDER}
+        self._write_task = asyncio.create_task(self._write_buffers(buffers))
+
+    async def _wait_for_write(self) -> None:
+        """Wait until no background write is in flight."""
+        while self._write_task:
+            task = self._write_task
+            await task
+            if self._write_task is task:
+                self._write_task = None
+
+    async def _write_buffers(self, buffers: dict[str, list[Row]]) -> None:
+        """
+        Write detached buffers table by table in FK order.
+
+        The whole flush shares one connection and commits once, without
+        waiting on the WAL flush. Each table runs in its own savepoint; a
+        failed batch is split and retried (see _write_rows) so one bad
+        row doesn't cost the rest. A lost connection, serialization
+        failure or deadlock rolls back the whole flush, which is retried
+        with jittered backoff before the error is re-raised.
+        """
+        tables = [table for table in FLUSH_ORDER if buffers[table]]
+        if not tables:
+            return
+
+        try:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type(RETRYABLE_WRITE_ERRORS),
+                wait=wait_random_exponential(multiplier=0.2, max=WRITE_RETRY_MAX_WAIT),
+                stop=stop_after_attempt(WRITE_RETRY_ATTEMPTS),
+                reraise=True,
+            ):
+                with attempt:
+                    # Counters bumped by a rolled-back attempt don't count
+                    stats = replace(self.stats)
+                    try:
+                        await self._write_tables(buffers, tables)
+                    except RETRYABLE_WRITE_ERRORS as e:
+                        self.stats = stats
+                        logger.warning(
+                            f"[{self.get_source_name()}] Write of {', '.join(tables)} "
+                            f"failed (attempt {attempt.retry_state.attempt_number}): {e}"
+                        )
+                        raise
+        except RETRYABLE_WRITE_ERRORS:
+            raise
+        except Exception as e:
+            self.log_error(f"Failed to write batch ({', '.join(tables)})", e)
+
+    async def _write_tables(self, buffers: dict[str, list[Row]], tables: list[str]) -> None:
+        """Write the given tables' buffers in one transaction."""
+        async with self.pool.acquire() as conn, conn.transaction():
+            # Ingests are rerunnable, so don't wait for the WAL flush on
+            # commit (a crash can lose the last batches, never corrupt)
+            await conn.execute("SET LOCAL synchronous_commit = off")
+            for table in tables:
+                written = await self._write_rows(conn, table, buffers[table])
+                stat = CREATED_STATS.get(table)
+                if stat:
+                    setattr(self.stats, stat, getattr(self.stats, stat) + written)
+
+    async def _write_rows(self, conn: asyncpg.Connection, table: str, rows: list[Row]) -> int:
+        """
+        Write rows in a savepoint, halving the batch on failure.
+
+        A bad row is thus isolated in about log2(len(rows)) retries and
+        logged on its own, while the rest of the batch is still written.
+
+        Returns:
+            Number of rows actually inserted.
+        """
+        try:
+            async with conn.transaction():
+                return await self._write_batch(conn, table, rows)
+        except RETRYABLE_WRITE_ERRORS:
+            raise
+        except Exception as e:
+            if len(rows) == 1:
+                row = rows[0]
+                row_id = row["id"] if isinstance(row, dict) else row.id
+                self.log_error(f"Failed to write {table} row {row_id}", e)
+                return 0
+
+        mid = len(rows) // 2
+        return (
+            await self._write_rows(conn, table, rows[:mid])
+            + await self._write_rows(conn, table, rows[mid:])
+        )
+
+    async def prefetch_existing(
+        self,
+        table: str,
+        key_col: str,
+        values: list[str],
+    ) -> dict[str, str]:
+        """
+        Look up existing rows for a whole set of keys at once.
+
+        A single `key_col = ANY($1)` query replaces a lookup per row; found
+        ids seed the id cache, so the matching create_* calls return without
+        touching the database. Keys must be the ones create_* caches under
+        (actors: name_primary, sources: digital_url).
+
+        Returns:
+            Mapping of key value -> existing row id.
+        """
+        pending = [v for v in dict.fromkeys(values) if v and (table, v) not in self._id_cache]
+        if not pending:
+            return {}
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"SELECT id::text, {key_col} FROM {table} WHERE {key_col} = ANY($1::text[])",
+                pending,
+            )
+        found = {row[key_col]: row["id"] for row in rows}
+
+        for value, row_id in found.items():
+            self._id_cache[(table, value)] = row_id
+        return found
+
+    async def drop_secondary_indexes(self, tables: tuple[str, ...]) -> list[str]:
+        """
+        Drop the plain (non-unique) btree indexes on `tables` before a large load.
+
+        COPY then skips maintaining them row by row; rebuild_indexes()
+        recreates each with one sort over the loaded table. Unique indexes
+        and constraint indexes stay, since they back primary keys, ON
+        CONFLICT targets and the dedup lookups in _copy_new_rows. So do
+        GiST, GIN and ivfflat indexes (map viewports, full-text and
+        embedding search read through them), the btrees listed in
+        READ_PATH_INDEXES and any clustered index.
+        Dropped CONCURRENTLY, so queries against the tables aren't blocked.
+
+        Returns:
+            Definitions of the dropped indexes, for rebuild_indexes().
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT i.indexrelid::regclass::text AS name,
+                       pg_get_indexdef(i.indexrelid) AS definition
+                FROM pg_index i
+                JOIN pg_class ic ON ic.oid = i.indexrelid
+                JOIN pg_am am ON am.oid = ic.relam
+                WHERE i.indrelid = ANY($1::text[]::regclass[])
+                  AND am.amname = 'btree'
+                  AND NOT i.indisunique
+                  AND NOT i.indisclustered
+                  AND ic.relname <> ALL($2::text[])
+                  AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+                """,
+                list(tables),
+                list(READ_PATH_INDEXES),
+            )
+            for row in rows:
+                await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {row['name']}")
+
+        self.log_progress(f"Dropped {len(rows)} indexes on {', '.join(tables)}")
+        return [row["definition"] for row in rows]
+
+    async def rebuild_indexes(self, definitions: list[str]) -> None:
+        """
+        Recreate indexes dropped by drop_secondary_indexes().
+
+        Built CONCURRENTLY, so writes to the tables aren't blocked by a
+        SHARE lock for the length of each build.
+        """
+        async with self.pool.acquire() as conn:
+            for definition in definitions:
+                # pg_get_indexdef() gives "CREATE [UNIQUE] INDEX name ON ..."
+                statement = definition.replace(" INDEX ", " INDEX CONCURRENTLY ", 1)
+                try:
+                    await conn.execute(statement, timeout=INDEX_BUILD_TIMEOUT)
+                except Exception as e:
+                    # Keep going, and log the statement so it can be rerun
+                    # (after dropping the INVALID index a failed build leaves)
+                    self.log_error(f"Failed to rebuild index: {statement}", e)
+
+        self.log_progress(f"Rebuilt {len(definitions)} indexes")
+
+    def _cached_id(self, keys: list[tuple]) -> str | None:
+        """Return the id cached under any of the given dedup keys."""
+        for key in keys:
+            if key in self._id_cache:
+                return self._id_cache[key]
         return None
 
+    async def _write_batch(self, conn: asyncpg.Connection, table: str, rows: list[Row]) -> int:
+        """
+        COPY one batch of rows into `table` on `conn`.
+
+        Returns:
+            Number of rows actually inserted.
+        """
+        if is_dataclass(rows[0]):
+            # Row dataclasses: one column set, records straight from the fields
+            columns, values = _row_layout(type(rows[0]))
+            by_columns = {columns: [list(values(row)) for row in rows]}
+        else:
+            # Dict rows only carry their non-None columns, so COPY each column
+            # set separately; omitted columns then take their DB default
+            by_columns: dict[tuple[str, ...], list[list]] = {}
+            for row in rows:
+                by_columns.setdefault(tuple(row), []).append(
+                    [_copy_value(v) for v in row.values()]
+                )
+
+        # Point references at rows that turned out to exist already
+        fk_columns = FK_COLUMNS.get(table, ())
+        if self._id_aliases and fk_columns:
+            aliases = self._id_aliases
+            for columns, records in by_columns.items():
+                for i, col in enumerate(columns):
+                    if col in fk_columns:
+                        for record in records:
+                            record[i] = aliases.get(record[i], record[i])
+
+        written = 0
+        for columns, records in by_columns.items():
+            if table in DEDUP_MATCH:
+                written += await self._copy_new_rows(conn, table, records, columns)
+            else:
+                await self._bulk_copy(conn, table, records, columns)
+                written += len(records)
+        return written
+
+    async def _copy_new_rows(
+        self,
+        conn: asyncpg.Connection,
+        table: str,
+        records: list[list],
+        columns: tuple[str, ...],
+    ) -> int:
+        """
+        Load rows into a DEDUP_MATCH table, skipping those that already exist.
+
+        Rows are COPYed into a temp staging table, then a single statement
+        inserts the new ones and reports (staged id, existing id) for the
+        rest - indexed probes run server-side instead of a lookup per row.
+        Skipped ids are recorded in _id_aliases so children buffered against
+        them are written with the existing id.
+
+        Returns:
+            Number of rows inserted.
+        """
+        matches, skipped_stat = DEDUP_MATCH[table]
+        staging = f"_stage_{table}"
+        await conn.execute(
+            f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        await conn.copy_to_table(
+            staging, source=_csv_source(records), columns=list(columns), format="csv"
+        )
+
+        column_list = ", ".join(columns)
+        probes = ", ".join(
+            f"(SELECT t.id FROM {table} t WHERE {match} LIMIT 1)" for match in matches
+        )
+        existing = await conn.fetch(
+            f"""
+            WITH existing AS (
+                SELECT staged_id, existing_id
+                FROM (
+                    SELECT s.id AS staged_id, COALESCE({probes}) AS existing_id
+                    FROM {staging} s
+                ) m
+                WHERE existing_id IS NOT NULL
+            ), inserted AS (
+                INSERT INTO {table} ({column_list})
+                SELECT {column_list} FROM {staging}
+                WHERE id NOT IN (SELECT staged_id FROM existing)
+            )
+            SELECT staged_id::text, existing_id::text FROM existing
+            """
+        )
+        # Dropped now so another column set in this transaction can reuse it
+        await conn.execute(f"DROP TABLE {staging}")
+
+        for staged_id, existing_id in existing:
+            self._id_aliases[staged_id] = existing_id
+        setattr(self.stats, skipped_stat, getattr(self.stats, skipped_stat) + len(existing))
+        return len(records) - len(existing)
+
+    async def _bulk_copy(
+        self,
+        conn: asyncpg.Connection,
+        table: str,
+        records: list[list],
+        columns: tuple[str, ...],
+    ) -> None:
+        """
+        Load records with COPY ... FROM STDIN.
+
+        Tables in BINARY_COPY_TABLES use binary COPY, skipping text parsing
+        on the server. The rest use CSV, which leaves JSON columns and
+        omitted-column defaults to PostgreSQL's input functions.
+
+        Tables in UPSERT_CONFLICT need ON CONFLICT DO NOTHING, which COPY
+        can't do; they go through one pipelined executemany of a prepared
+        INSERT instead. asyncpg keeps the statement in the pooled
+        connection's cache, so it is parsed and planned once per connection.
+        """
+        if table in UPSERT_CONFLICT:
+            await conn.executemany(_upsert_sql(table, columns), records)
+        elif table in BINARY_COPY_TABLES:
+            await conn.copy_records_to_table(table, records=records, columns=list(columns))
+        else:
+            await conn.copy_to_table(
+                table,
+                source=_csv_source(records),
+                columns=list(columns),
+                format="csv",
+            )
+
     # ==========================================
     # UTILITIES
     # ==========================================
@@ -477,17 +1113,25 @@ class BaseIngestor(ABC):
 
     def log_error(self, message: str, exc: Exception | None = None) -> None:
         """Log error message."""
-        self.stats["errors"] += 1
+        self.stats.errors += 1
         if exc:
             logger.error(f"[{self.get_source_name()}] {message}: {exc}")
         else:
             logger.error(f"[{self.get_source_name()}] {message}")
 
+    async def invalidate_map_cache(self) -> None:
+        """Drop cached map API tiles so new rows show up immediately."""
+        try:
+            deleted = await tile_cache.invalidate_map_cache()
+            self.log_progress(f"Cleared {deleted} cached map tiles")
+        except Exception as e:
+            # Cache entries expire on their own; don't fail the ingest
+            logger.warning(f"[{self.get_source_name()}] Could not clear map cache: {e}")
+
     def get_stats(self) -> dict[str, Any]:
         """Return current ingestion statistics."""
-        from datetime import datetime
         return {
             "source": self.get_source_name(),
-            "timestamp": datetime.utcnow().isoformat(),
-            **self.stats,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **asdict(self.stats),
         }
@@ -1,7 +1,8 @@
 """
 Internet Archive data ingestor.
 
-Uses the internetarchive Python library to search and catalog historical texts.
+Uses the archive.org advanced search and metadata JSON APIs to search and
+catalog historical texts.
 https://archive.org/
 
 CATALOG-ONLY MODE:
@@ -12,15 +13,24 @@ Creates: sources (secondary/tertiary texts)
 Does NOT create: factoids, actors, locations
 """
 
+import asyncio
 import logging
 from typing import Any
 
+import httpx
+import orjson
 from tqdm import tqdm
 
-from .base import BaseIngestor
+from .base import BaseIngestor, HTTP2_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+IA_SEARCH_URL = "https://archive.org/advancedsearch.php"
+IA_METADATA_URL = "https://archive.org/metadata/{identifier}"
+
+# archive.org requests in flight at once (searches and metadata fetches)
+IA_CONCURRENCY = 16
+
 # Curated searches for MVP historical content
 # These are small, targeted searches - NOT bulk ingestion
 MVP_SEARCHES = [
@@ -119,26 +129,9 @@ class InternetArchiveIngestor(BaseIngestor):
     - locations
     """
 
-    def __init__(self, data_dir: str = "./data"):
-        super().__init__(data_dir)
-        self._ia = None
-
     def get_source_name(self) -> str:
         return "Internet Archive"
 
-    def _get_ia(self):
-        """Lazy load internetarchive module."""
-        if self._ia is None:
-            try:
-                import internetarchive as ia
-                self._ia = ia
-            except ImportError:
-                raise ImportError(
-                    "internetarchive library not installed. "
-                    "Run: pip install internetarchive"
-                )
-        return self._ia
-
     async def ingest(
         self,
         searches: list[dict] | None = None,
@@ -155,63 +148,118 @@ class InternetArchiveIngestor(BaseIngestor):
             Ingestion statistics.
         """
         await self.connect()
-        ia = self._get_ia()
+        ia = _ia_client()
 
         try:
             searches = searches or MVP_SEARCHES
-            all_items = []
+            # At most IA_CONCURRENCY archive.org requests at a time, sharing
+            # the client's keep-alive connections
+            sem = asyncio.Semaphore(IA_CONCURRENCY)
 
             self.log_progress(f"Running {len(searches)} curated searches...")
 
             # Collect items from all searches
-            for search_config in searches:
-                query = search_config["query"]
-                name = search_config["name"]
-                limit = limit_per_search or search_config.get("limit", 10)
-
-                self.log_progress(f"  Searching: {name} (limit {limit})")
-
-                try:
-                    results = ia.search_items(query, max_results=limit)
-                    items = list(results)
-                    all_items.extend([(item, search_config) for item in items])
-                    self.log_progress(f"    Found {len(items)} items")
-                except Exception as e:
-                    self.log_error(f"Search failed for '{name}'", e)
+            results = await asyncio.gather(*(
+                self._search(ia, search_config, limit_per_search, sem)
+                for search_config in searches
+            ))
+            all_items = [pair for items in results for pair in items]
+
+            # Searches overlap; keep the first hit so each item is fetched once
+            seen: set[str] = set()
+            unique_items = []
+            for item, search_config in all_items:
+                identifier = item.get("identifier")
+                if identifier in seen:
+                    continue
+                if identifier:
+                    seen.add(identifier)
+                unique_items.append((item, search_config))
+            if len(unique_items) < len(all_items):
+                self.log_progress(f"  Skipping {len(all_items) - len(unique_items)} duplicate results")
+            all_items = unique_items
 
             self.log_progress(f"Processing {len(all_items)} total items...")
 
-            # Process each item
-            for item_data, search_config in tqdm(all_items, desc="Internet Archive"):
-                try:
-                    await self._process_item(ia, item_data, search_config)
-                except Exception as e:
-                    identifier = item_data.get("identifier", "unknown")
-                    self.log_error(f"Failed to process item {identifier}", e)
-
+            # Find already-cataloged items in bulk so they skip the metadata fetch
+            existing = await self.prefetch_existing(
+                "sources",
+                "digital_url",
+                [self._digital_url(item["identifier"]) for item, _ in all_items if item.get("identifier")],
+            )
+            if existing:
+                self.log_progress(f"  {len(existing)} items already cataloged")
+
+            # Process items concurrently
+            with tqdm(total=len(all_items), desc="Internet Archive", mininterval=0.5) as progress:
+                async def process(item_data: dict, search_config: dict) -> None:
+                    try:
+                        await self._process_item(ia, item_data, search_config, sem)
+                    except Exception as e:
+                        identifier = item_data.get("identifier", "unknown")
+                        self.log_error(f"Failed to process item {identifier}", e)
+                    finally:
+                        progress.update()
+
+                await asyncio.gather(*(process(*pair) for pair in all_items))
+
+            await self.flush()
             self.log_progress("Ingestion complete!")
             return self.get_stats()
 
         finally:
+            await ia.aclose()
             await self.close()
 
+    async def _search(
+        self,
+        ia: httpx.AsyncClient,
+        search_config: dict,
+        limit_per_search: int | None,
+        sem: asyncio.Semaphore,
+    ) -> list[tuple[dict, dict]]:
+        """Run one curated search, returning (item, search_config) pairs."""
+        query = search_config["query"]
+        name = search_config["name"]
+        limit = limit_per_search or search_config.get("limit", 10)
+
+        try:
+            async with sem:
+                self.log_progress(f"  Searching: {name} (limit {limit})")
+                items = await _search_items(ia, query, limit)
+        except Exception as e:
+            self.log_error(f"Search failed for '{name}'", e)
+            return []
+
+        self.log_progress(f"    Found {len(items)} items for {name}")
+        return [(item, search_config) for item in items]
+
     async def _process_item(
         self,
-        ia,
+        ia: httpx.AsyncClient,
         item_data: dict,
         search_config: dict,
+        sem: asyncio.Semaphore,
     ) -> None:
         """Process a single Internet Archive item into a source record."""
         identifier = item_data.get("identifier", "")
 
         if not identifier:
-            self.stats["sources_skipped"] += 1
+            self.stats.sources_skipped += 1
+            return
+
+        # Build digital URL
+        digital_url = self._digital_url(identifier)
+
+        # Already cataloged (see prefetch_existing)
+        if ("sources", digital_url) in self._id_cache:
+            self.stats.sources_skipped += 1
             return
 
         # Get full item metadata
         try:
-            item = ia.get_item(identifier)
-            metadata = item.metadata
+            async with sem:
+                metadata = await _get_metadata(ia, identifier)
         except Exception as e:
             self.log_error(f"Failed to get metadata for {identifier}", e)
             return
@@ -239,9 +287,6 @@ class InternetArchiveIngestor(BaseIngestor):
         # Determine genre
         genre = search_config.get("genre")
 
-        # Build digital URL
-        digital_url = f"https://archive.org/details/{identifier}"
-
         # Create source record
         await self.create_source(
             title=title,
@@ -253,6 +298,43 @@ class InternetArchiveIngestor(BaseIngestor):
             external_id=f"ia:{identifier}",
         )
 
+    @staticmethod
+    def _digital_url(identifier: str) -> str:
+        """Canonical archive.org URL for an item (the source dedup key)."""
+        return f"https://archive.org/details/{identifier}"
+
+
+def _ia_client() -> httpx.AsyncClient:
+    """Async client for archive.org, with a connection per concurrent request."""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=60.0,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=IA_CONCURRENCY,
+            max_keepalive_connections=IA_CONCURRENCY,
+        ),
+    )
+
+
+async def _search_items(client: httpx.AsyncClient, query: str, limit: int) -> list[dict]:
+    """Run an advanced search, returning `{"identifier": ...}` docs."""
+    response = await client.get(IA_SEARCH_URL, params={
+        "q": query,
+        "fl[]": "identifier",
+        "rows": limit,
+        "output": "json",
+    })
+    response.raise_for_status()
+    return orjson.loads(response.content)["response"]["docs"]
+
+
+async def _get_metadata(client: httpx.AsyncClient, identifier: str) -> dict:
+    """Fetch an item's metadata (empty for unknown items)."""
+    response = await client.get(IA_METADATA_URL.format(identifier=identifier))
+    response.raise_for_status()
+    return orjson.loads(response.content).get("metadata", {})
+
 
 async def search_internet_archive(query: str, limit: int = 10) -> list[dict]:
     """
@@ -267,22 +349,19 @@ async def search_internet_archive(query: str, limit: int = 10) -> list[dict]:
     Returns:
         List of item metadata dictionaries.
     """
-    import internetarchive as ia
-
-    results = ia.search_items(query, max_results=limit)
-    items = []
-
-    for item_data in results:
-        identifier = item_data.get("identifier")
-        if identifier:
-            item = ia.get_item(identifier)
-            items.append({
-                "identifier": identifier,
-                "title": item.metadata.get("title", ""),
-                "creator": item.metadata.get("creator", ""),
-                "date": item.metadata.get("date", ""),
-                "language": item.metadata.get("language", ""),
-                "url": f"https://archive.org/details/{identifier}",
-            })
-
-    return items
+    async with _ia_client() as client:
+        results = await _search_items(client, query, limit)
+        identifiers = [r["identifier"] for r in results if r.get("identifier")]
+        metadata = await asyncio.gather(*(_get_metadata(client, i) for i in identifiers))
+
+    return [
+        {
+            "identifier": identifier,
+            "title": meta.get("title", ""),
+            "creator": meta.get("creator", ""),
+            "date": meta.get("date", ""),
+            "language": meta.get("language", ""),
+            "url": f"https://archive.org/details/{identifier}",
+        }
+        for identifier, meta in zip(identifiers, metadata)
+    ]
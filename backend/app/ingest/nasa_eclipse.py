@@ -14,12 +14,22 @@ Creates: factoids + factoid_placements + locations (for path)
 Source: NASA GSFC Eclipse Website
 """
 
+import asyncio
+import calendar
 import csv
 import logging
-from datetime import date
+import os
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Parses and converts whole CSV columns in C (see _parse_with_arrow)
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from tqdm import tqdm
 
 from .base import BaseIngestor
@@ -27,6 +37,7 @@ from .base import BaseIngestor
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
 def make_date_string(year: int, month: int, day: int) -> str:
     """
     Create a date string that handles BCE years for PostgreSQL.
@@ -40,6 +51,9 @@ def make_date_string(year: int, month: int, day: int) -> str:
 
     Returns:
         PostgreSQL date string (e.g., "0584-05-28 BC" or "0029-11-24")
+
+    Cached: catalogs repeat the same days (and every row renders its date
+    twice, for the name and the placement).
     """
     if year <= 0:
         # BCE year - format with BC suffix for PostgreSQL
@@ -48,6 +62,7 @@ def make_date_string(year: int, month: int, day: int) -> str:
     else:
         return f"{year:04d}-{month:02d}-{day:02d}"
 
+
 # NASA Eclipse catalog URLs (for reference - data should be downloaded)
 # Solar: https://eclipse.gsfc.nasa.gov/SEcat5/SE-1999--1900.html
 # Lunar: https://eclipse.gsfc.nasa.gov/LEcat5/LE-1999--1900.html
@@ -64,6 +79,397 @@ ECLIPSE_TYPES = {
 }
 
 
+@lru_cache(maxsize=8192)
+def make_date_display(year: int) -> str:
+    """
+    Format a year with BC/AD notation for display.
+
+    Takes the same astronomical-style year as make_date_string, so the era
+    never has to be parsed back out of the date string.
+    """
+    if year <= 0:
+        return f"{abs(year)} BC"
+    return f"{year} AD"
+
+
+@dataclass(frozen=True, slots=True)
+class Eclipse:
+    """
+    One eclipse to ingest, from the sample list or a NASA catalog row.
+
+    The date and display text _create_eclipse_factoid writes are derived
+    once, on construction, from the (year, month, day) `ymd`.
+    """
+
+    ymd: tuple[int, int, int]  # Negative years for BCE
+    type: str
+    name: str
+    description: str
+    lat: float | None
+    lon: float | None
+    confidence: float = 0.95
+    layer: str = "documented"
+    raw_observation: str | None = None
+
+    date: str = field(init=False)
+    type_label: str = field(init=False)
+    summary: str = field(init=False)
+    full_description: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        year = self.ymd[0]
+        type_label = ECLIPSE_TYPES.get(self.type, "Eclipse")
+        object.__setattr__(self, "date", make_date_string(*self.ymd))
+        object.__setattr__(self, "type_label", type_label)
+        object.__setattr__(self, "summary", f"{type_label} on {make_date_display(year)}")
+        object.__setattr__(self, "full_description", f"{self.name}: {self.description}")
+
+
+# Historically significant eclipses (well-documented in ancient sources),
+# built once at import
+# Dates are (year, month, day) with negative years for BCE, since Python
+# date() doesn't support them (see Eclipse)
+_HISTORICAL_ECLIPSES: tuple[Eclipse, ...] = (
+    Eclipse(
+        ymd=(-584, 5, 28),  # 585 BCE
+        type="T",
+        name="Eclipse of Thales",
+        description="Solar eclipse predicted by Thales of Miletus. Said to have stopped the battle between Lydians and Medes.",
+        lat=39.0,
+        lon=35.0,
+        confidence=0.95,
+        layer="attested",
+        raw_observation="Herodotus, Histories 1.74: 'Day was turned into night'",
+    ),
+    Eclipse(
+        ymd=(-430, 8, 3),  # 431 BCE
+        type="A",
+        name="Eclipse at start of Peloponnesian War",
+        description="Annular solar eclipse at the start of the Peloponnesian War, recorded by Thucydides.",
+        lat=38.0,
+        lon=23.7,
+        confidence=0.95,
+        layer="attested",
+        raw_observation="Thucydides 2.28: 'The sun was eclipsed'",
+    ),
+    Eclipse(
+        ymd=(-309, 8, 15),  # 310 BCE
+        type="T",
+        name="Eclipse of Agathocles",
+        description="Total solar eclipse observed as Agathocles sailed from Syracuse to Africa.",
+        lat=37.0,
+        lon=15.0,
+        confidence=0.90,
+        layer="attested",
+        raw_observation="Diodorus Siculus 20.5",
+    ),
+    Eclipse(
+        ymd=(-189, 3, 14),  # 190 BCE
+        type="A",
+        name="Eclipse before Battle of Magnesia",
+        description="Annular eclipse recorded before the Roman-Seleucid Battle of Magnesia.",
+        lat=38.6,
+        lon=27.4,
+        confidence=0.90,
+        layer="attested",
+        raw_observation="Livy 37.4.4",
+    ),
+    Eclipse(
+        ymd=(-167, 6, 21),  # 168 BCE
+        type="T+",
+        name="Eclipse before Battle of Pydna",
+        description="Total lunar eclipse the night before the Battle of Pydna. Sulpicius Gallus predicted it.",
+        lat=40.4,
+        lon=22.5,
+        confidence=0.95,
+        layer="documented",
+        raw_observation="Livy 44.37.5-9; Pliny NH 2.53",
+    ),
+    Eclipse(
+        ymd=(-43, 5, 24),  # 44 BCE
+        type="P",
+        name="Eclipse after Caesar's assassination",
+        description="Partial solar eclipse following Julius Caesar's assassination. Associated with 'Caesar's Comet'.",
+        lat=41.9,
+        lon=12.5,
+        confidence=0.85,
+        layer="attested",
+        raw_observation="Multiple Roman sources mention darkened sun",
+    ),
+    Eclipse(
+        ymd=(29, 11, 24),  # 29 CE
+        type="T",
+        name="Eclipse near Crucifixion date",
+        description="Total solar eclipse visible in the Mediterranean region, one of several candidates for the 'darkness' at the Crucifixion.",
+        lat=32.0,
+        lon=35.0,
+        confidence=0.70,  # Lower - controversial dating
+        layer="traditional",
+        raw_observation="Phlegon of Tralles fragment preserved in Origen",
+    ),
+    Eclipse(
+        ymd=(59, 4, 30),  # 59 CE
+        type="A",
+        name="Eclipse in reign of Nero",
+        description="Annular solar eclipse recorded during Nero's reign.",
+        lat=41.9,
+        lon=12.5,
+        confidence=0.90,
+        layer="documented",
+        raw_observation="Tacitus Annals 14.12",
+    ),
+    Eclipse(
+        ymd=(71, 3, 20),  # 71 CE
+        type="T",
+        name="Eclipse during Jewish War",
+        description="Total solar eclipse during the Roman siege of Jerusalem.",
+        lat=31.8,
+        lon=35.2,
+        confidence=0.90,
+        layer="attested",
+        raw_observation="Josephus references",
+    ),
+    Eclipse(
+        ymd=(364, 6, 16),  # 364 CE
+        type="T",
+        name="Eclipse of Julian's Persian campaign",
+        description="Total solar eclipse during Emperor Julian's Persian campaign.",
+        lat=33.0,
+        lon=44.0,
+        confidence=0.90,
+        layer="documented",
+        raw_observation="Ammianus Marcellinus 25.10.2",
+    ),
+    Eclipse(
+        ymd=(484, 1, 14),  # 484 CE
+        type="T",
+        name="Eclipse recorded in Chinese sources",
+        description="Total solar eclipse recorded in both Roman and Chinese sources.",
+        lat=35.0,
+        lon=110.0,
+        confidence=0.95,
+        layer="documented",
+        raw_observation="Chinese dynastic histories",
+    ),
+    Eclipse(
+        ymd=(590, 10, 4),  # 590 CE
+        type="T",
+        name="Eclipse during Gregory of Tours' time",
+        description="Total solar eclipse recorded by Gregory of Tours.",
+        lat=47.4,
+        lon=0.7,
+        confidence=0.90,
+        layer="documented",
+        raw_observation="Gregory of Tours, History of the Franks 10.23",
+    ),
+    Eclipse(
+        ymd=(840, 5, 5),  # 840 CE
+        type="T",
+        name="Eclipse and death of Louis the Pious",
+        description="Total solar eclipse shortly before the death of Louis the Pious. Seen as an omen.",
+        lat=49.0,
+        lon=7.0,
+        confidence=0.95,
+        layer="documented",
+        raw_observation="Multiple Carolingian sources",
+    ),
+    Eclipse(
+        ymd=(1133, 8, 2),  # 1133 CE
+        type="T",
+        name="King Henry's Eclipse",
+        description="Total solar eclipse associated with the death of King Henry I of England.",
+        lat=51.5,
+        lon=-0.1,
+        confidence=0.95,
+        layer="documented",
+        raw_observation="William of Malmesbury",
+    ),
+)
+
+# The NASA source record, created once per database
+NASA_SOURCE_TITLE = "NASA GSFC Eclipse Website"
+NASA_SOURCE_URL = "https://eclipse.gsfc.nasa.gov/"
+
+# Ids of source rows known to exist, by (digital_url, title), kept across
+# ingests in this process (retries, several runs in one worker)
+_SOURCE_ID_CACHE: dict[tuple[str, str], str] = {}
+
+# CSV rows parsed per Arrow batch
+PARSE_CHUNK_SIZE = 10_000
+
+# Catalogs at least this long are loaded without secondary indexes when
+# ingest(rebuild_indexes=True), and the tables they write to
+REBUILD_INDEXES_MIN_ROWS = 50_000
+# (locations is left out: its indexes serve every map viewport query and
+# the CLUSTER ordering of migration 009)
+ECLIPSE_TABLES = ("factoids", "factoid_placements", "factoid_sources", "connections")
+
+
+@dataclass(frozen=True, slots=True)
+class NasaColumns:
+    """Positions of the columns parse_nasa_batch reads, resolved once from the header."""
+
+    date: int | None
+    type: int | None
+    latitude: int | None
+    longitude: int | None
+
+    @classmethod
+    def from_header(cls, header: list[str]) -> "NasaColumns":
+        """Resolve each column by the first of its known names present in the header."""
+        positions = {name: i for i, name in reversed(list(enumerate(header)))}
+
+        def find(*names: str) -> int | None:
+            return next((positions[n] for n in names if n in positions), None)
+
+        return cls(
+            date=find("Date", "date", "Calendar Date"),
+            type=find("Type", "type", "Eclipse Type"),
+            latitude=find("Latitude"),
+            longitude=find("Longitude"),
+        )
+
+
+# A catalog date, (-)year-month-day with - or / separators, and a decimal
+# coordinate, for the Arrow regex kernels (which need the named groups
+# and anchors)
+_DATE_PATTERN = r"^(?P<year>-?\d+)[-/](?P<month>\d+)[-/](?P<day>\d+)$"
+_FLOAT_PATTERN = r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$"
+
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_valid_date(year: int, month: int, day: int) -> bool:
+    """Whether PostgreSQL accepts make_date_string(year, month, day)."""
+    if year == 0 or not 1 <= month <= 12 or not 1 <= day <= _DAYS_IN_MONTH[month]:
+        return False
+    if month == 2 and day == 29:
+        # make_date_string writes year <= 0 as "abs(year) BC", which
+        # PostgreSQL reads as astronomical year 1 + year
+        return calendar.isleap(year if year > 0 else year + 1)
+    return True
+
+
+def _nasa_eclipse(
+    ymd: tuple[int, int, int],
+    eclipse_type: str | None,
+    lat: float | None,
+    lon: float | None,
+) -> Eclipse:
+    """Build the Eclipse for one parsed NASA catalog row."""
+    eclipse_type = (eclipse_type or "T")[0]
+    return Eclipse(
+        ymd=ymd,
+        type=eclipse_type,
+        name=f"Eclipse of {make_date_string(*ymd)}",
+        description=f"{ECLIPSE_TYPES.get(eclipse_type, 'Eclipse')} recorded by NASA GSFC",
+        lat=lat,
+        lon=lon,
+        confidence=0.99,  # NASA calculations are extremely precise
+        layer="documented",
+    )
+
+
+def _count_rows(file_path: Path) -> int:
+    """Number of data rows in a CSV file (by line, without parsing)."""
+    with open(file_path, "rb") as f:
+        return max(sum(1 for _ in f) - 1, 0)
+
+
+def _read_eclipse_table(file_path: Path) -> tuple["pa.Table", NasaColumns, int]:
+    """
+    Read a whole CSV file into an Arrow table of strings (multi-threaded, in C).
+
+    Returns:
+        (table, column positions, number of malformed rows skipped)
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    columns = NasaColumns.from_header(header)
+    if not header:
+        return pa.table({}), columns, 0
+
+    malformed = 0
+
+    def skip_row(row: "pa_csv.InvalidRow") -> str:
+        nonlocal malformed
+        malformed += 1
+        return "skip"
+
+    table = pa_csv.read_csv(
+        file_path,
+        parse_options=pa_csv.ParseOptions(invalid_row_handler=skip_row),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+        ),
+    )
+    return table, columns, malformed
+
+
+def _arrow_floats(values: "pa.Array") -> tuple[list, list[bool]]:
+    """Convert a string column to floats; returns (floats, which rows were invalid)."""
+    values = pc.utf8_trim_whitespace(values)
+    valid = pc.match_substring_regex(values, _FLOAT_PATTERN)
+    floats = pc.cast(pc.if_else(valid, values, pa.scalar(None, pa.string())), pa.float64())
+    invalid = pc.and_(pc.invert(valid), pc.not_equal(values, ""))
+    return floats.to_pylist(), pc.fill_null(invalid, False).to_pylist()
+
+
+def parse_nasa_batch(batch: "pa.RecordBatch", columns: NasaColumns) -> tuple[list, list]:
+    """
+    Parse a batch of NASA rows column-wise with Arrow compute kernels.
+
+    The date match, int casts and coordinate checks and casts run over
+    whole columns; only the final Eclipses are built per row. Bad values
+    are reported, not raised, so a catalog with many malformed rows
+    doesn't pay for an exception each.
+
+    Returns:
+        (rows as tuples of strings, for error messages; parsed rows)
+    """
+    size = batch.num_rows
+
+    def column(index: int | None) -> "pa.Array":
+        if index is None:
+            return pa.array([""] * size, pa.string())
+        return batch.column(index)
+
+    dates = pc.extract_regex(pc.utf8_trim_whitespace(column(columns.date)), _DATE_PATTERN)
+    years, months, days = (
+        pc.cast(pc.struct_field(dates, [i]), pa.int64()).to_pylist() for i in range(3)
+    )
+    lats, bad_lats = _arrow_floats(column(columns.latitude))
+    lons, bad_lons = _arrow_floats(column(columns.longitude))
+    types = column(columns.type).to_pylist()
+
+    rows = list(zip(*(c.to_pylist() for c in batch.columns)))
+    parsed: list[Eclipse | str | None] = []
+    for i in range(size):
+        if years[i] is None:
+            date_str = rows[i][columns.date].strip() if columns.date is not None else ""
+            parsed.append(f"unrecognized date {date_str!r}" if date_str else None)
+        elif not _is_valid_date(years[i], months[i], days[i]):
+            parsed.append(f"invalid date {rows[i][columns.date].strip()!r}")
+        elif bad_lats[i] or bad_lons[i]:
+            parsed.append("invalid coordinate")
+        else:
+            parsed.append(
+                _nasa_eclipse((years[i], months[i], days[i]), types[i], lats[i], lons[i])
+            )
+    return rows, parsed
+
+
+async def _parse_with_arrow(file_path: Path) -> AsyncIterator[tuple[list, list]]:
+    """Yield (rows, parsed) per batch of a CSV file read with pyarrow."""
+    table, columns, malformed = await asyncio.to_thread(_read_eclipse_table, file_path)
+    if malformed:
+        logger.warning(f"Skipped {malformed} malformed rows in {file_path.name}")
+
+    for batch in table.to_batches(max_chunksize=PARSE_CHUNK_SIZE):
+        yield await asyncio.to_thread(parse_nasa_batch, batch, columns)
+
+
 class NASAEclipseIngestor(BaseIngestor):
     """
     Ingestor for NASA historical eclipse data.
@@ -83,7 +489,11 @@ class NASAEclipseIngestor(BaseIngestor):
     def get_source_name(self) -> str:
         return "NASA Eclipse Data"
 
-    async def ingest(self, limit: int | None = None) -> dict[str, Any]:
+    async def ingest(
+        self,
+        limit: int | None = None,
+        rebuild_indexes: bool = False,
+    ) -> dict[str, Any]:
         """
         Ingest NASA eclipse data.
 
@@ -92,6 +502,8 @@ class NASAEclipseIngestor(BaseIngestor):
 
         Args:
             limit: Optional limit on number of eclipses to ingest.
+            rebuild_indexes: Drop secondary indexes while loading catalogs
+                of REBUILD_INDEXES_MIN_ROWS or more, and rebuild them after.
 
         Returns:
             Ingestion statistics.
@@ -99,33 +511,79 @@ class NASAEclipseIngestor(BaseIngestor):
         await self.connect()
 
         try:
-            # Create NASA source record
-            self.nasa_source_id = await self.create_source(
-                title="NASA GSFC Eclipse Website",
-                source_type="tertiary",  # Compiled scientific data
-                genre="astronomical_catalog",
-                raw_dating_evidence="Calculated from astronomical algorithms",
-                digital_url="https://eclipse.gsfc.nasa.gov/",
-            )
-
-            # Find eclipse data files
-            data_path = Path(self.data_dir)
-            eclipse_files = list(data_path.glob("*eclipse*.csv")) + list(data_path.glob("*eclipse*.txt"))
+            self.nasa_source_id = await self._get_nasa_source_id()
 
+            eclipse_files = self._find_eclipse_files()
             if not eclipse_files:
                 self.log_progress("No eclipse data files found. Creating sample data...")
                 await self._ingest_sample_historical_eclipses(limit)
             else:
-                for eclipse_file in eclipse_files:
-                    self.log_progress(f"Processing: {eclipse_file.name}")
-                    await self._process_eclipse_file(eclipse_file, limit)
+                index_definitions = []
+                if rebuild_indexes and not limit:
+                    row_counts = await asyncio.gather(
+                        *(asyncio.to_thread(_count_rows, path) for path in eclipse_files)
+                    )
+                    if sum(row_counts) >= REBUILD_INDEXES_MIN_ROWS:
+                        index_definitions = await self.drop_secondary_indexes(ECLIPSE_TABLES)
 
+                try:
+                    for eclipse_file in eclipse_files:
+                        self.log_progress(f"Processing: {eclipse_file.name}")
+                        await self._process_eclipse_file(eclipse_file, limit)
+                    await self.flush()
+                finally:
+                    if index_definitions:
+                        await self.rebuild_indexes(index_definitions)
+
+            await self.flush()
+            await self.invalidate_map_cache()
             self.log_progress("Ingestion complete!")
             return self.get_stats()
 
         finally:
             await self.close()
 
+    async def _get_nasa_source_id(self) -> str | None:
+        """
+        Get or create the NASA source record.
+
+        An id already seen in this process is reused without a query;
+        otherwise one lookup finds an existing row. Only ids confirmed in
+        the database are cached, so a failed write is never remembered.
+        """
+        cache_key = (NASA_SOURCE_URL, NASA_SOURCE_TITLE)
+        source_id = _SOURCE_ID_CACHE.get(cache_key)
+        if source_id:
+            # Seeds create_source's own dedup cache
+            self._id_cache[("sources", NASA_SOURCE_URL)] = source_id
+        else:
+            found = await self.prefetch_existing("sources", "digital_url", [NASA_SOURCE_URL])
+            if NASA_SOURCE_URL in found:
+                _SOURCE_ID_CACHE[cache_key] = found[NASA_SOURCE_URL]
+
+        return await self.create_source(
+            title=NASA_SOURCE_TITLE,
+            source_type="tertiary",  # Compiled scientific data
+            genre="astronomical_catalog",
+            raw_dating_evidence="Calculated from astronomical algorithms",
+            digital_url=NASA_SOURCE_URL,
+        )
+
+    def _find_eclipse_files(self) -> list[Path]:
+        """Find eclipse data files in one directory pass for both extensions."""
+        try:
+            with os.scandir(self.data_dir) as entries:
+                return [
+                    Path(entry.path)
+                    for entry in entries
+                    if "eclipse" in entry.name
+                    and entry.name.endswith((".csv", ".txt"))
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            # No data directory: fall back to the sample eclipses
+            return []
+
     async def _ingest_sample_historical_eclipses(self, limit: int | None = None) -> None:
         """
         Ingest a curated set of historically significant eclipses.
@@ -133,167 +591,8 @@ class NASAEclipseIngestor(BaseIngestor):
         These are eclipses mentioned in historical records that help
         anchor chronology.
         """
-        # Historically significant eclipses (well-documented in ancient sources)
-        # Using make_date_string() for BCE dates since Python date() doesn't support them
-        historical_eclipses = [
-            {
-                "date": make_date_string(-584, 5, 28),  # 585 BCE
-                "type": "T",
-                "name": "Eclipse of Thales",
-                "description": "Solar eclipse predicted by Thales of Miletus. Said to have stopped the battle between Lydians and Medes.",
-                "lat": 39.0,
-                "lon": 35.0,
-                "confidence": 0.95,
-                "layer": "attested",
-                "raw_observation": "Herodotus, Histories 1.74: 'Day was turned into night'",
-            },
-            {
-                "date": make_date_string(-430, 8, 3),  # 431 BCE
-                "type": "A",
-                "name": "Eclipse at start of Peloponnesian War",
-                "description": "Annular solar eclipse at the start of the Peloponnesian War, recorded by Thucydides.",
-                "lat": 38.0,
-                "lon": 23.7,
-                "confidence": 0.95,
-                "layer": "attested",
-                "raw_observation": "Thucydides 2.28: 'The sun was eclipsed'",
-            },
-            {
-                "date": make_date_string(-309, 8, 15),  # 310 BCE
-                "type": "T",
-                "name": "Eclipse of Agathocles",
-                "description": "Total solar eclipse observed as Agathocles sailed from Syracuse to Africa.",
-                "lat": 37.0,
-                "lon": 15.0,
-                "confidence": 0.90,
-                "layer": "attested",
-                "raw_observation": "Diodorus Siculus 20.5",
-            },
-            {
-                "date": make_date_string(-189, 3, 14),  # 190 BCE
-                "type": "A",
-                "name": "Eclipse before Battle of Magnesia",
-                "description": "Annular eclipse recorded before the Roman-Seleucid Battle of Magnesia.",
-                "lat": 38.6,
-                "lon": 27.4,
-                "confidence": 0.90,
-                "layer": "attested",
-                "raw_observation": "Livy 37.4.4",
-            },
-            {
-                "date": make_date_string(-167, 6, 21),  # 168 BCE
-                "type": "T+",
-                "name": "Eclipse before Battle of Pydna",
-                "description": "Total lunar eclipse the night before the Battle of Pydna. Sulpicius Gallus predicted it.",
-                "lat": 40.4,
-                "lon": 22.5,
-                "confidence": 0.95,
-                "layer": "documented",
-                "raw_observation": "Livy 44.37.5-9; Pliny NH 2.53",
-            },
-            {
-                "date": make_date_string(-43, 5, 24),  # 44 BCE
-                "type": "P",
-                "name": "Eclipse after Caesar's assassination",
-                "description": "Partial solar eclipse following Julius Caesar's assassination. Associated with 'Caesar's Comet'.",
-                "lat": 41.9,
-                "lon": 12.5,
-                "confidence": 0.85,
-                "layer": "attested",
-                "raw_observation": "Multiple Roman sources mention darkened sun",
-            },
-            {
-                "date": make_date_string(29, 11, 24),  # 29 CE
-                "type": "T",
-                "name": "Eclipse near Crucifixion date",
-                "description": "Total solar eclipse visible in the Mediterranean region, one of several candidates for the 'darkness' at the Crucifixion.",
-                "lat": 32.0,
-                "lon": 35.0,
-                "confidence": 0.70,  # Lower - controversial dating
-                "layer": "traditional",
-                "raw_observation": "Phlegon of Tralles fragment preserved in Origen",
-            },
-            {
-                "date": make_date_string(59, 4, 30),  # 59 CE
-                "type": "A",
-                "name": "Eclipse in reign of Nero",
-                "description": "Annular solar eclipse recorded during Nero's reign.",
-                "lat": 41.9,
-                "lon": 12.5,
-                "confidence": 0.90,
-                "layer": "documented",
-                "raw_observation": "Tacitus Annals 14.12",
-            },
-            {
-                "date": make_date_string(71, 3, 20),  # 71 CE
-                "type": "T",
-                "name": "Eclipse during Jewish War",
-                "description": "Total solar eclipse during the Roman siege of Jerusalem.",
-                "lat": 31.8,
-                "lon": 35.2,
-                "confidence": 0.90,
-                "layer": "attested",
-                "raw_observation": "Josephus references",
-            },
-            {
-                "date": make_date_string(364, 6, 16),  # 364 CE
-                "type": "T",
-                "name": "Eclipse of Julian's Persian campaign",
-                "description": "Total solar eclipse during Emperor Julian's Persian campaign.",
-                "lat": 33.0,
-                "lon": 44.0,
-                "confidence": 0.90,
-                "layer": "documented",
-                "raw_observation": "Ammianus Marcellinus 25.10.2",
-            },
-            {
-                "date": make_date_string(484, 1, 14),  # 484 CE
-                "type": "T",
-                "name": "Eclipse recorded in Chinese sources",
-                "description": "Total solar eclipse recorded in both Roman and Chinese sources.",
-                "lat": 35.0,
-                "lon": 110.0,
-                "confidence": 0.95,
-                "layer": "documented",
-                "raw_observation": "Chinese dynastic histories",
-            },
-            {
-                "date": make_date_string(590, 10, 4),  # 590 CE
-                "type": "T",
-                "name": "Eclipse during Gregory of Tours' time",
-                "description": "Total solar eclipse recorded by Gregory of Tours.",
-                "lat": 47.4,
-                "lon": 0.7,
-                "confidence": 0.90,
-                "layer": "documented",
-                "raw_observation": "Gregory of Tours, History of the Franks 10.23",
-            },
-            {
-                "date": make_date_string(840, 5, 5),  # 840 CE
-                "type": "T",
-                "name": "Eclipse and death of Louis the Pious",
-                "description": "Total solar eclipse shortly before the death of Louis the Pious. Seen as an omen.",
-                "lat": 49.0,
-                "lon": 7.0,
-                "confidence": 0.95,
-                "layer": "documented",
-                "raw_observation": "Multiple Carolingian sources",
-            },
-            {
-                "date": make_date_string(1133, 8, 2),  # 1133 CE
-                "type": "T",
-                "name": "King Henry's Eclipse",
-                "description": "Total solar eclipse associated with the death of King Henry I of England.",
-                "lat": 51.5,
-                "lon": -0.1,
-                "confidence": 0.95,
-                "layer": "documented",
-                "raw_observation": "William of Malmesbury",
-            },
-        ]
-
         count = 0
-        for eclipse in tqdm(historical_eclipses, desc="Historical eclipses"):
+        for eclipse in tqdm(_HISTORICAL_ECLIPSES, desc="Historical eclipses"):
             if limit and count >= limit:
                 break
 
@@ -301,20 +600,19 @@ class NASAEclipseIngestor(BaseIngestor):
                 await self._create_eclipse_factoid(eclipse)
                 count += 1
             except Exception as e:
-                self.log_error(f"Failed to create eclipse: {eclipse['name']}", e)
+                self.log_error(f"Failed to create eclipse: {eclipse.name}", e)
 
-    async def _create_eclipse_factoid(self, eclipse: dict) -> None:
+    async def _create_eclipse_factoid(self, eclipse: Eclipse) -> None:
         """Create a factoid and placement for an eclipse."""
-        eclipse_type = ECLIPSE_TYPES.get(eclipse["type"], "Eclipse")
-        date_str = eclipse["date"]  # Already a string from make_date_string()
+        date_str = eclipse.date  # From make_date_string(), for BCE support
 
         # Create the factoid
         factoid_id = await self.create_factoid(
-            description=f"{eclipse['name']}: {eclipse['description']}",
-            summary=f"{eclipse_type} on {self._format_date_display(date_str)}",
+            description=eclipse.full_description,
+            summary=eclipse.summary,
             factoid_type="event",
-            layer=eclipse.get("layer", "documented"),
-            raw_observation=eclipse.get("raw_observation"),
+            layer=eclipse.layer,
+            raw_observation=eclipse.raw_observation,
             raw_observation_type="document_text",
             status="verified",  # NASA data is verified
         )
@@ -328,7 +626,7 @@ class NASAEclipseIngestor(BaseIngestor):
             date_start=date_str,
             date_end=date_str,
             date_precision="exact",
-            placement_confidence=eclipse.get("confidence", 0.95),
+            placement_confidence=eclipse.confidence,
             reasoning="Astronomically calculated eclipse date from NASA GSFC",
             placement_type="system",
         )
@@ -342,15 +640,15 @@ class NASAEclipseIngestor(BaseIngestor):
             )
 
         # Create location for eclipse visibility
-        if eclipse.get("lat") and eclipse.get("lon"):
+        if eclipse.lat and eclipse.lon:
             location_id = await self.create_location(
-                name_modern=f"Eclipse visibility: {eclipse['name']}",
+                name_modern=f"Eclipse visibility: {eclipse.name}",
                 location_type="area",
                 location_subtype="eclipse_path",
-                latitude=eclipse["lat"],
-                longitude=eclipse["lon"],
+                latitude=eclipse.lat,
+                longitude=eclipse.lon,
                 uncertainty_radius_km=500.0,  # Eclipse paths are wide
-                description=f"Central path of {eclipse_type.lower()}",
+                description=f"Central path of {eclipse.type_label.lower()}",
             )
 
             # Connect factoid to location
@@ -366,71 +664,48 @@ class NASAEclipseIngestor(BaseIngestor):
                 )
 
     async def _process_eclipse_file(self, file_path: Path, limit: int | None) -> None:
-        """Process a NASA eclipse data file."""
+        """
+        Process a NASA eclipse data file.
+
+        Whole columns are parsed with pyarrow, a batch at a time.
+        """
         # This handles the actual NASA data format if user downloads it
         # Format varies but typically includes: date, time, type, coordinates
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            count = 0
-
-            for row in reader:
-                if limit and count >= limit:
-                    break
-
-                try:
-                    # Try to parse common NASA formats
-                    eclipse = self._parse_nasa_row(row)
-                    if eclipse:
-                        await self._create_eclipse_factoid(eclipse)
-                        count += 1
-                except Exception as e:
-                    self.log_error(f"Failed to parse row: {row}", e)
-
-    def _parse_nasa_row(self, row: dict) -> dict | None:
-        """Parse a row from NASA eclipse data."""
-        # Handle various NASA formats
-        # This is a simplified parser - real NASA data has specific formats
-
-        # Try to get date
-        date_str = row.get("Date") or row.get("date") or row.get("Calendar Date")
-        if not date_str:
-            return None
-
-        # Parse date (NASA uses various formats)
-        try:
-            parts = date_str.replace("/", "-").split("-")
-            if len(parts) == 3:
-                year = int(parts[0])
-                month = int(parts[1])
-                day = int(parts[2])
-                eclipse_date = date(year, month, day)
-            else:
-                return None
-        except ValueError:
-            return None
-
-        eclipse_type = row.get("Type") or row.get("type") or row.get("Eclipse Type") or "T"
-
-        return {
-            "date": eclipse_date,
-            "type": eclipse_type[0] if eclipse_type else "T",
-            "name": f"Eclipse of {self._format_date(eclipse_date)}",
-            "description": f"{ECLIPSE_TYPES.get(eclipse_type[0], 'Eclipse')} recorded by NASA GSFC",
-            "lat": float(row.get("Latitude", 0)) if row.get("Latitude") else None,
-            "lon": float(row.get("Longitude", 0)) if row.get("Longitude") else None,
-            "confidence": 0.99,  # NASA calculations are extremely precise
-            "layer": "documented",
-        }
-
-    def _format_date_display(self, date_str: str) -> str:
-        """Format PostgreSQL date string with BC/AD notation for display."""
-        # Parse PostgreSQL date string like "0584-05-28 BC" or "0029-11-24"
-        if date_str.endswith(" BC"):
-            # BC date
-            parts = date_str.replace(" BC", "").split("-")
-            year = int(parts[0])
-            return f"{year} BC"
-        else:
-            parts = date_str.split("-")
-            year = int(parts[0])
-            return f"{year} AD"
+        count = 0
+        row_number = 1  # The header
+        bad_rows: list[tuple[int, str, Any]] = []
+
+        # Advanced once per chunk, so the bar costs nothing per row
+        with tqdm(desc=file_path.name, unit=" rows", mininterval=1.0, smoothing=0.0) as progress:
+            async with aclosing(_parse_with_arrow(file_path)) as chunks:
+                async for rows, parsed in chunks:
+                    progress.update(len(rows))
+                    for row, eclipse in zip(rows, parsed):
+                        row_number += 1
+                        if limit and count >= limit:
+                            break
+                        if isinstance(eclipse, str):
+                            bad_rows.append((row_number, eclipse, row))
+                            continue
+                        if not eclipse:
+                            continue
+
+                        try:
+                            await self._create_eclipse_factoid(eclipse)
+                            count += 1
+                        except Exception as e:
+                            self.log_error(f"Failed to create eclipse: {eclipse.name}", e)
+
+                    if limit and count >= limit:
+                        break
+
+        if bad_rows:
+            # One report per file instead of a log line per malformed row
+            self.stats.errors += len(bad_rows)
+            examples = "; ".join(
+                f"row {number}: {reason} in {row}" for number, reason, row in bad_rows[:5]
+            )
+            logger.error(
+                f"[{self.get_source_name()}] Skipped {len(bad_rows)} unparseable rows "
+                f"in {file_path.name} ({examples})"
+            )
@@ -12,18 +12,28 @@ Creates: sources (primary texts), actors (ancient authors)
 Does NOT create: factoids, locations
 """
 
+import asyncio
 import json
 import logging
-import xml.etree.ElementTree as ET
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from lxml import etree as ET
 from tqdm import tqdm
 
 from .base import BaseIngestor
 
 logger = logging.getLogger(__name__)
 
+# Author directories processed at once. CTS files are parsed in worker
+# threads (libxml2 releases the GIL), so parses overlap with each other
+# and with DB writes
+AUTHOR_CONCURRENCY = 16
+
 # TLG author IDs to names and metadata
 TLG_AUTHORS = {
     "tlg0001": {"name": "Apollonius Rhodius", "dates": "3rd century BCE", "type": "person"},
@@ -79,8 +89,173 @@ GENRE_MAP = {
     "description": "geography",
 }
 
+# Author-name keywords and the genre they imply, checked in this order
+# when the title has no genre keyword
+AUTHOR_GENRES = (
+    (("homer",), "epic_poetry"),
+    (("herodotus", "thucydides", "polybius", "diodorus"), "historiography"),
+    (("plato", "aristotle"), "philosophy"),
+    (("demosthenes", "isocrates", "lysias"), "oratory"),
+    (("sophocles", "euripides", "aeschylus"), "tragedy"),
+    (("aristophanes",), "comedy"),
+    (("plutarch",), "biography"),
+)
+
+
+def _keyword_matcher(rules) -> tuple[re.Pattern, tuple]:
+    """
+    Compile (keywords, genre) rules into one regex plus its genres.
+
+    Alternative i is ".*?(kw|kw...)", so a match's lastindex is the first
+    rule, in rule order, with a keyword anywhere in the string - the same
+    answer as testing the rules one by one, from a single C-level search.
+    """
+    rules = tuple(rules)
+    pattern = "|".join(
+        ".*?(" + "|".join(map(re.escape, keywords)) + ")" for keywords, _ in rules
+    )
+    return re.compile(pattern, re.DOTALL), tuple(genre for _, genre in rules)
+
+
+GENRE_TITLE_RE, GENRE_TITLE_GENRES = _keyword_matcher(
+    ((keyword,), genre) for keyword, genre in GENRE_MAP.items()
+)
+GENRE_AUTHOR_RE, GENRE_AUTHOR_GENRES = _keyword_matcher(AUTHOR_GENRES)
+
+
+@lru_cache(maxsize=8192)
+def _determine_title_genre(title: str) -> str | None:
+    """Determine genre from a work title's keywords (titles recur a lot)."""
+    if m := GENRE_TITLE_RE.match(title.lower()):
+        return GENRE_TITLE_GENRES[m.lastindex - 1]
+    return None
+
+
+def _determine_author_genre(author: str) -> str | None:
+    """Default genre for an author's works, from the author name."""
+    if m := GENRE_AUTHOR_RE.match(author.lower()):
+        return GENRE_AUTHOR_GENRES[m.lastindex - 1]
+    return None
+
+
 # CTS namespace
 CTS_NS = {"ti": "http://chs.harvard.edu/xmlns/cts"}
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+# Qualified CTS tag names, as lxml reports them ("{uri}name"); tags are
+# compared against these whole instead of being split per element
+TI_GROUPNAME = f"{{{CTS_NS['ti']}}}groupname"
+TI_TITLE = f"{{{CTS_NS['ti']}}}title"
+
+# iterparse tag filters ("{*}" = any or no namespace): libxml2 skips every
+# other element in C, so only these ever reach Python
+AUTHOR_CTS_TAGS = ("{*}groupname",)
+WORK_CTS_TAGS = ("{*}title", "{*}edition", "{*}translation")
+
+# libxml2 options for every __cts__.xml; the files are small metadata
+# records, so skip whitespace-only text nodes and the xml:id table
+CTS_PARSE_OPTIONS = {"remove_blank_text": True, "collect_ids": False, "resolve_entities": False}
+
+
+def _subdirs(path: str | Path) -> list[os.DirEntry]:
+    """
+    Subdirectories of `path`, sorted by name.
+
+    scandir's entries carry their file type from the directory listing,
+    so telling directories apart costs no stat() per entry.
+    """
+    with os.scandir(path) as entries:
+        return sorted((e for e in entries if e.is_dir()), key=lambda e: e.name)
+
+
+def _get_author_name(cts_file: Path, author_id: str) -> str:
+    """Get author name from CTS XML or fallback to TLG lookup."""
+    # A missing file fails the open like any unreadable one, which saves
+    # an exists() stat on every author directory
+    try:
+        # Stream the file and stop at the first CTS groupname; a
+        # groupname outside the namespace is kept as a fallback
+        fallback = None
+        for _, elem in ET.iterparse(str(cts_file), tag=AUTHOR_CTS_TAGS, **CTS_PARSE_OPTIONS):
+            if elem.text and elem.text.strip():
+                if elem.tag == TI_GROUPNAME:
+                    return elem.text.strip()
+                fallback = fallback or elem.text.strip()
+        if fallback:
+            return fallback
+
+    except Exception:
+        pass
+
+    # Fallback to TLG lookup
+    return TLG_AUTHORS.get(author_id, {}).get("name", author_id)
+
+
+@dataclass(frozen=True, slots=True)
+class Edition:
+    """An edition or translation listed in a work's CTS metadata."""
+
+    urn: str
+    lang: str
+    description: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WorkInfo:
+    """Work-level CTS metadata, as read by _parse_work_cts."""
+
+    urn: str
+    lang: str
+    editions: list[Edition]
+    title: str | None = None
+
+
+def _parse_work_cts(cts_file: Path) -> WorkInfo | None:
+    """
+    Parse work-level CTS XML metadata, or None if missing or unreadable.
+
+    One streaming pass: titles and editions are read as they close and
+    then cleared, so the full tree is never held. A missing file is not
+    stat()ed first; the failed open is handled like any unreadable file.
+    """
+    try:
+        # Preferred title: an English CTS title, else the first CTS
+        # title, else the first title in any namespace
+        eng_title = cts_title = any_title = None
+        editions = []
+
+        context = ET.iterparse(str(cts_file), tag=WORK_CTS_TAGS, **CTS_PARSE_OPTIONS)
+        for _, elem in context:
+            # (the tag filter only lets titles, editions and translations through)
+            if elem.tag.endswith("title"):
+                text = elem.text.strip() if elem.text else ""
+                if text:
+                    any_title = any_title or text
+                    if elem.tag == TI_TITLE:
+                        cts_title = cts_title or text
+                        if elem.get(XML_LANG, "") == "eng":
+                            eng_title = eng_title or text
+
+            # Get editions/translations info
+            else:
+                description = None
+                for child in elem.iterchildren("{*}description"):
+                    if child.text:
+                        description = child.text.strip()
+                editions.append(Edition(elem.get("urn", ""), elem.get(XML_LANG, ""), description))
+
+            elem.clear()
+
+        root = context.root
+        return WorkInfo(
+            urn=root.get("urn", ""),
+            lang=root.get(XML_LANG, "grc"),
+            editions=editions,
+            title=eng_title or cts_title or any_title,
+        )
+
+    except Exception:
+        return None
 
 
 class PerseusIngestor(BaseIngestor):
@@ -125,230 +300,148 @@ class PerseusIngestor(BaseIngestor):
             data_path = greek_lit_path / "data"
 
             # Find all author directories
-            author_dirs = sorted([d for d in data_path.iterdir() if d.is_dir()])
+            author_dirs = _subdirs(data_path)
             self.log_progress(f"Found {len(author_dirs)} author directories")
 
-            works_processed = 0
-
-            for author_dir in tqdm(author_dirs, desc="Perseus Authors"):
-                if limit and works_processed >= limit:
-                    break
-
-                try:
-                    count = await self._process_author(
-                        author_dir,
-                        limit - works_processed if limit else None,
-                    )
-                    works_processed += count
-                except Exception as e:
-                    self.log_error(f"Failed to process author {author_dir.name}", e)
-
+            # Works cataloged so far, shared by the concurrent authors. A
+            # limited run takes authors one at a time, so it catalogs the
+            # first works in directory order and no author past the limit
+            self._limit = limit
+            self._works_processed = 0
+            sem = asyncio.Semaphore(1 if limit else AUTHOR_CONCURRENCY)
+
+            with tqdm(total=len(author_dirs), desc="Perseus Authors") as progress:
+                async def process(author_dir: os.DirEntry) -> None:
+                    try:
+                        async with sem:
+                            if not self._limit_reached():
+                                await self._process_author(author_dir)
+                    except Exception as e:
+                        self.log_error(f"Failed to process author {author_dir.name}", e)
+                    finally:
+                        progress.update()
+
+                await asyncio.gather(*(process(d) for d in author_dirs))
+
+            # Write the last partial batch so the stats include it
+            await self.flush()
             self.log_progress("Ingestion complete!")
             return self.get_stats()
 
         finally:
             await self.close()
 
-    async def _process_author(
-        self,
-        author_dir: Path,
-        remaining_limit: int | None,
-    ) -> int:
+    def _limit_reached(self) -> bool:
+        """Whether the ingest's work limit has been used up."""
+        return bool(self._limit) and self._works_processed >= self._limit
+
+    async def _process_author(self, author_dir: os.DirEntry) -> int:
         """Process an author directory and return count of works processed."""
         author_id = author_dir.name  # e.g., "tlg0012"
 
         # Get author info
         author_info = TLG_AUTHORS.get(author_id, {})
-        author_name = self._get_author_name(author_dir / "__cts__.xml", author_id)
+        raw_period = author_info.get("dates", "")
+        author_name = await asyncio.to_thread(
+            _get_author_name, Path(author_dir.path, "__cts__.xml"), author_id
+        )
 
         # Create actor for author
         author_actor_id = await self.create_actor(
             name_primary=author_name,
             actor_type=author_info.get("type", "person"),
-            raw_temporal_evidence=author_info.get("dates", ""),
+            raw_temporal_evidence=raw_period,
             known_biases=author_info.get("biases"),
             external_id=f"tlg:{author_id}",
-            description=f"Ancient author. {author_info.get('dates', '')}",
+            description=f"Ancient author. {raw_period}",
         )
 
-        # Find work directories
-        work_dirs = sorted([d for d in author_dir.iterdir() if d.is_dir()])
+        # Genre for works whose title names none; constant per author
+        author_genre = _determine_author_genre(author_name)
+
+        # Source fields shared by every work of this author; the period
+        # covered is built from the author's dates
+        source_fields = {
+            "author_id": author_actor_id,
+            "raw_dating_evidence": raw_period,
+            "raw_period_covered": f"Written {raw_period}" if raw_period else None,
+            "digital_url": f"https://scaife.perseus.org/reader/urn:cts:greekLit:{author_id}",
+        }
+
+        # Find work directories and parse their metadata all at once; a
+        # limited run parses only as many as it may still catalog, topping
+        # up when some turn out unusable
+        work_dirs = _subdirs(author_dir.path)
         works_processed = 0
-
-        for work_dir in work_dirs:
-            if remaining_limit and works_processed >= remaining_limit:
-                break
-
-            try:
-                processed = await self._process_work(
-                    work_dir,
-                    author_id,
-                    author_name,
-                    author_actor_id,
-                )
-                if processed:
-                    works_processed += 1
-            except Exception as e:
-                self.log_error(f"Failed to process work {work_dir.name}", e)
+        start = 0
+
+        while start < len(work_dirs) and not self._limit_reached():
+            if self._limit:
+                end = start + self._limit - self._works_processed
+            else:
+                end = len(work_dirs)
+            batch = work_dirs[start:end]
+            start = end
+
+            work_infos = await asyncio.gather(*(
+                asyncio.to_thread(_parse_work_cts, Path(work_dir.path, "__cts__.xml"))
+                for work_dir in batch
+            ))
+
+            for work_dir, work_info in zip(batch, work_infos):
+                try:
+                    processed = await self._process_work(
+                        work_dir,
+                        work_info,
+                        author_genre,
+                        source_fields,
+                    )
+                    if processed:
+                        works_processed += 1
+                except Exception as e:
+                    self.log_error(f"Failed to process work {work_dir.name}", e)
 
         return works_processed
 
     async def _process_work(
         self,
-        work_dir: Path,
-        author_id: str,
-        author_name: str,
-        author_actor_id: str | None,
+        work_dir: os.DirEntry,
+        work_info: WorkInfo | None,
+        author_genre: str | None,
+        source_fields: dict[str, Any],
     ) -> bool:
-        """Process a single work directory. Returns True if work was processed."""
-        # Read work CTS metadata
-        cts_file = work_dir / "__cts__.xml"
-        if not cts_file.exists():
-            return False
-
-        work_info = self._parse_work_cts(cts_file)
+        """
+        Process a single work directory from its parsed CTS metadata.
+        Returns True if work was processed.
+        """
         if not work_info:
             return False
 
-        work_title = work_info.get("title", work_dir.name)
-        work_urn = work_info.get("urn", "")
+        work_title = work_info.title or work_dir.name
 
         # Determine genre
-        genre = self._determine_genre(work_title, author_name)
+        genre = _determine_title_genre(work_title) or author_genre
 
         # Determine original language
-        original_lang = work_info.get("lang", "grc")
+        original_lang = work_info.lang
         if original_lang == "grc":
             original_lang = "Ancient Greek"
         elif original_lang == "lat":
             original_lang = "Latin"
 
         # Get edition info
-        editions = work_info.get("editions", [])
-        edition_notes = None
-        if editions:
-            edition_notes = "; ".join(
-                e.get("description", "")[:200] for e in editions if e.get("description")
-            )
-
-        # Build period covered from author dates
-        author_info = TLG_AUTHORS.get(author_id, {})
-        raw_period = author_info.get("dates", "")
+        descriptions = [e.description[:200] for e in work_info.editions if e.description]
+        edition_notes = "; ".join(descriptions) if descriptions else None
 
         # Create source record
         await self.create_source(
             title=f"{work_title}",
             source_type="primary",
             genre=genre,
-            author_id=author_actor_id,
-            raw_dating_evidence=raw_period,
-            raw_period_covered=f"Written {raw_period}" if raw_period else None,
             original_language=original_lang,
-            digital_url=f"https://scaife.perseus.org/reader/urn:cts:greekLit:{author_id}",
+            edition_notes=edition_notes,
+            **source_fields,
         )
 
+        self._works_processed += 1
         return True
-
-    def _get_author_name(self, cts_file: Path, author_id: str) -> str:
-        """Get author name from CTS XML or fallback to TLG lookup."""
-        if cts_file.exists():
-            try:
-                tree = ET.parse(cts_file)
-                root = tree.getroot()
-
-                # Try with namespace
-                groupname = root.find(".//ti:groupname", CTS_NS)
-                if groupname is not None and groupname.text:
-                    return groupname.text.strip()
-
-                # Try without namespace
-                for elem in root.iter():
-                    if elem.tag.endswith("groupname") and elem.text:
-                        return elem.text.strip()
-
-            except Exception:
-                pass
-
-        # Fallback to TLG lookup
-        return TLG_AUTHORS.get(author_id, {}).get("name", author_id)
-
-    def _parse_work_cts(self, cts_file: Path) -> dict | None:
-        """Parse work-level CTS XML metadata."""
-        try:
-            tree = ET.parse(cts_file)
-            root = tree.getroot()
-
-            result = {
-                "urn": root.get("urn", ""),
-                "lang": root.get("{http://www.w3.org/XML/1998/namespace}lang", "grc"),
-            }
-
-            # Get title - try various approaches
-            title = None
-
-            # Try with namespace
-            for title_elem in root.findall(".//ti:title", CTS_NS):
-                lang = title_elem.get("{http://www.w3.org/XML/1998/namespace}lang", "")
-                if lang == "eng" and title_elem.text:
-                    title = title_elem.text.strip()
-                    break
-                elif title_elem.text and not title:
-                    title = title_elem.text.strip()
-
-            # Try without namespace
-            if not title:
-                for elem in root.iter():
-                    if elem.tag.endswith("title") and elem.text:
-                        title = elem.text.strip()
-                        break
-
-            if title:
-                result["title"] = title
-
-            # Get editions/translations info
-            editions = []
-            for elem in root.iter():
-                if elem.tag.endswith(("edition", "translation")):
-                    ed_info = {
-                        "urn": elem.get("urn", ""),
-                        "lang": elem.get("{http://www.w3.org/XML/1998/namespace}lang", ""),
-                    }
-                    for child in elem:
-                        if child.tag.endswith("description") and child.text:
-                            ed_info["description"] = child.text.strip()
-                    editions.append(ed_info)
-
-            result["editions"] = editions
-
-            return result
-
-        except Exception:
-            return None
-
-    def _determine_genre(self, title: str, author: str) -> str | None:
-        """Determine genre from title and author."""
-        title_lower = title.lower()
-        author_lower = author.lower()
-
-        # Check title
-        for keyword, genre in GENRE_MAP.items():
-            if keyword in title_lower:
-                return genre
-
-        # Check author-based defaults
-        if "homer" in author_lower:
-            return "epic_poetry"
-        if any(x in author_lower for x in ["herodotus", "thucydides", "polybius", "diodorus"]):
-            return "historiography"
-        if any(x in author_lower for x in ["plato", "aristotle"]):
-            return "philosophy"
-        if any(x in author_lower for x in ["demosthenes", "isocrates", "lysias"]):
-            return "oratory"
-        if any(x in author_lower for x in ["sophocles", "euripides", "aeschylus"]):
-            return "tragedy"
-        if "aristophanes" in author_lower:
-            return "comedy"
-        if "plutarch" in author_lower:
-            return "biography"
-
-        return None
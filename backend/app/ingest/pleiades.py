@@ -93,7 +93,7 @@ class PleiadesIngestor(BaseIngestor):
             self.log_progress(f"Processing {len(places)} places...")
 
             # First pass: Create locations and collect connections
-            for place in tqdm(places, desc="Pleiades locations"):
+            for place in tqdm(places, desc="Pleiades locations", mininterval=0.5):
                 try:
                     await self._process_place(place)
                 except Exception as e:
@@ -108,6 +108,8 @@ class PleiadesIngestor(BaseIngestor):
             elif self.pending_connections:
                 self.log_progress(f"Skipping {len(self.pending_connections)} connections (skip_connections=True)")
 
+            await self.flush()
+            await self.invalidate_map_cache()
             self.log_progress("Ingestion complete!")
             return self.get_stats()
 
@@ -191,7 +193,7 @@ class PleiadesIngestor(BaseIngestor):
         title = place.get("title", "").strip()
 
         if not title:
-            self.stats["locations_skipped"] += 1
+            self.stats.locations_skipped += 1
             return
 
         # Get representative point coordinates
@@ -202,7 +204,7 @@ class PleiadesIngestor(BaseIngestor):
         location_type, location_subtype = self._map_place_types(place_types)
 
         # Build structured historical names from names array
-        historical_names = self._build_historical_names(place, pleiades_id)
+        historical_names = self._build_historical_names(place)
 
         # Parse locations into location_changes (different positions over time)
         location_changes = self._parse_location_changes(place)
@@ -254,7 +256,7 @@ class PleiadesIngestor(BaseIngestor):
         skipped_missing = 0
         skipped_error = 0
 
-        for from_pleiades_id, conn in tqdm(self.pending_connections, desc="Pleiades connections"):
+        for from_pleiades_id, conn in tqdm(self.pending_connections, desc="Pleiades connections", mininterval=0.5):
             try:
                 # Get the "from" location UUID from cache
                 from_uuid = self.location_id_cache.get(from_pleiades_id)
@@ -436,7 +438,7 @@ class PleiadesIngestor(BaseIngestor):
 
         return None, None
 
-    def _build_historical_names(self, place: dict, pleiades_id: str) -> list:
+    def _build_historical_names(self, place: dict) -> list:
         """
         Build structured historical names from Pleiades names array.
 
@@ -501,10 +503,6 @@ class PleiadesIngestor(BaseIngestor):
         if not names and title:
             names.append({"name": title, "source": "Pleiades Gazetteer"})
 
-        # Add the Pleiades identifier for deduplication
-        if pleiades_id:
-            names.append(f"pleiades:{pleiades_id}")
-
         return names
 
     def _year_to_date_string(self, year: int) -> str:
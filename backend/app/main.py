@@ -3,14 +3,19 @@ HistoryBuff API - FastAPI Application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
+from app.core.db_pool import init_pool, close_pool
+from app.core.redis_client import close_redis
+from app.services.geo_vec import warm_up as warm_up_geo_kernels
 from app.api.routes import health, factoids, sources, map
 
 app = FastAPI(
     title="HistoryBuff API",
     description="Historical research platform API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
 )
@@ -31,6 +36,20 @@ app.include_router(sources.router, prefix="/api/sources", tags=["sources"])
 app.include_router(map.router, prefix="/api/map", tags=["map"])
 
 
+@app.on_event("startup")
+async def startup():
+    await init_pool()
+    warm_up_geo_kernels()
+    app.state.health_probe = health.start_probe_loop()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.health_probe.cancel()
+    await close_pool()
+    await close_redis()
+
+
 @app.get("/")
 async def root():
     return {"message": "HistoryBuff API", "docs": "/docs"}
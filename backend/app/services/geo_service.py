@@ -11,9 +11,9 @@ from dataclasses import dataclass
 EARTH_RADIUS_KM = 6371.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
-    """Geographic bounding box."""
+    """Geographic bounding box. Immutable and hashable, so usable as a cache key."""
     sw_lng: float  # Southwest longitude
     sw_lat: float  # Southwest latitude
     ne_lng: float  # Northeast longitude
@@ -26,6 +26,17 @@ class BoundingBox:
             self.sw_lat <= lat <= self.ne_lat
         )
 
+    def intersects(self, other: "BoundingBox") -> bool:
+        """Check if two bounding boxes overlap (PostGIS && semantics)."""
+        return (
+            self.sw_lng <= other.ne_lng and other.sw_lng <= self.ne_lng and
+            self.sw_lat <= other.ne_lat and other.sw_lat <= self.ne_lat
+        )
+
+    def to_envelope_params(self) -> Tuple[float, float, float, float]:
+        """Parameters for ST_MakeEnvelope(xmin, ymin, xmax, ymax, 4326)."""
+        return (self.sw_lng, self.sw_lat, self.ne_lng, self.ne_lat)
+
 
 def haversine_distance(
     lng1: float, lat1: float,
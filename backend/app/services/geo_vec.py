@@ -0,0 +1,119 @@
+"""
+Vectorized geographic calculations.
+
+NumPy counterparts of the scalar functions in geo_service, used to
+measure many candidate points against a single center in one pass
+instead of calling math.sin/cos per row.
+
+When numba is installed the Haversine kernel is JIT-compiled into a
+single fused loop (no temporary arrays); otherwise plain NumPy is used.
+"""
+import math
+
+import numpy as np
+
+from app.services.geo_service import EARTH_RADIUS_KM
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _haversine_kernel(lng, lat, center_lng, center_lat, out):
+        """Fused Haversine over all points, written into out."""
+        center_lat_rad = math.radians(center_lat)
+        cos_center_lat = math.cos(center_lat_rad)
+        for i in prange(lng.size):
+            lat_rad = math.radians(lat[i])
+            sin_dlat = math.sin((lat_rad - center_lat_rad) / 2)
+            sin_dlng = math.sin(math.radians(lng[i] - center_lng) / 2)
+            a = sin_dlat * sin_dlat + cos_center_lat * math.cos(lat_rad) * sin_dlng * sin_dlng
+            a = min(max(a, 0.0), 1.0)
+            out[i] = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+else:
+    _haversine_kernel = None
+
+
+def warm_up() -> None:
+    """Compile (or load the cached) JIT kernel so requests don't pay for it."""
+    points = np.zeros(4, dtype=np.float64)
+    haversine_km(points, points, 0.0, 0.0)
+
+
+def haversine_km(
+    lng: np.ndarray,
+    lat: np.ndarray,
+    center_lng: float,
+    center_lat: float,
+) -> np.ndarray:
+    """
+    Great-circle distance from a center point to each point (Haversine).
+
+    Args:
+        lng, lat: Point coordinates in degrees (same shape)
+        center_lng, center_lat: Center point in degrees
+
+    Returns:
+        Distances in kilometers
+    """
+    if _haversine_kernel is not None:
+        lng = np.ascontiguousarray(lng, dtype=np.float64)
+        lat = np.ascontiguousarray(lat, dtype=np.float64)
+        out = np.empty_like(lng)
+        _haversine_kernel(lng, lat, float(center_lng), float(center_lat), out)
+        return out
+
+    lat_rad = np.radians(lat)
+    center_lat_rad = np.radians(center_lat)
+    delta_lat = lat_rad - center_lat_rad
+    delta_lng = np.radians(lng - center_lng)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2 +
+        np.cos(center_lat_rad) * np.cos(lat_rad) *
+        np.sin(delta_lng / 2) ** 2
+    )
+    # Clip guards against rounding pushing a just outside [0, 1]
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def flat_km(
+    lng: np.ndarray,
+    lat: np.ndarray,
+    center_lng: float,
+    center_lat: float,
+) -> np.ndarray:
+    """
+    Flat plane distance from a center point to each point.
+
+    Same approximation as calculate_distance(model="flat"): degrees are
+    scaled to km using the cosine of each pair's average latitude.
+    """
+    avg_lat = np.radians((lat + center_lat) / 2)
+    dx = (lng - center_lng) * 111.32 * np.cos(avg_lat)
+    dy = (lat - center_lat) * 110.574
+    return np.hypot(dx, dy)
+
+
+def distances_km(
+    lng: np.ndarray,
+    lat: np.ndarray,
+    center_lng: float,
+    center_lat: float,
+    model: str = "spherical",
+) -> np.ndarray:
+    """
+    Distance from a center point to each point.
+
+    Args:
+        model: "spherical" for Haversine, "flat" for Euclidean
+
+    Returns:
+        Distances in kilometers
+    """
+    if model == "flat":
+        return flat_km(lng, lat, center_lng, center_lat)
+    return haversine_km(lng, lat, center_lng, center_lat)
@@ -1,28 +1,134 @@
 """
 Map service - handles data fetching and transformation for the map view.
 """
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Sequence, AsyncIterator, Tuple
 from uuid import UUID
-from supabase import Client
+
+import asyncpg
+import numpy as np
 
 from app.services.geo_service import (
-    calculate_distance,
     expand_bounds,
     BoundingBox,
     create_circle_polygon,
 )
+from app.services.geo_vec import distances_km
+
+
+def _first_historical_name(historical_names: Optional[list]) -> Optional[str]:
+    """Display string for a location's name_historical jsonb list (the first entry)."""
+    if not historical_names:
+        return None
+    first = historical_names[0]
+    return first.get("name") if isinstance(first, dict) else first
+
+
+@lru_cache(maxsize=8)
+def _factoid_sql(has_layers: bool, has_categories: bool, has_bounds: bool) -> str:
+    """
+    Build the map factoid query for one filter shape.
+
+    Parameters are $1 = limit, followed by layers, categories and the four
+    envelope coordinates, each only if present. asyncpg keeps a prepared
+    statement per distinct query text on each connection, so every shape
+    is parsed and planned once per connection.
+    """
+    n = 1
+    filters = []
+    if has_layers:
+        n += 1
+        filters.append(f"AND layer = ANY(${n}::text[])")
+    if has_categories:
+        n += 1
+        filters.append(f"AND factoid_type = ANY(${n}::text[])")
+    bbox_clause = ""
+    if has_bounds:
+        bbox_clause = f"AND l.geom && ST_MakeEnvelope(${n + 1}, ${n + 2}, ${n + 3}, ${n + 4}, 4326)"
+
+    # Limit applies to factoids (not factoid-location rows), and only
+    # factoids with at least one linked location in bounds are returned
+    return f"""
+        SELECT
+            f.id,
+            f.summary,
+            f.description,
+            f.layer,
+            f.factoid_type,
+            f.community_confidence,
+            l.id AS location_id,
+            l.name_modern,
+            l.name_historical,
+            l.coordinate_x,
+            l.coordinate_y,
+            l.location_type,
+            l.location_subtype,
+            l.uncertainty_radius_km
+        FROM (
+            SELECT id, summary, description, layer, factoid_type, community_confidence
+            FROM factoids
+            WHERE deleted_at IS NULL
+              {" ".join(filters)}
+              AND EXISTS (
+                  SELECT 1
+                  FROM factoid_locations fl
+                  JOIN locations l ON l.id = fl.location_id
+                  WHERE fl.factoid_id = factoids.id
+                  {bbox_clause}
+              )
+            LIMIT $1
+        ) f
+        JOIN factoid_locations fl ON fl.factoid_id = f.id
+        JOIN locations l ON l.id = fl.location_id
+        WHERE TRUE
+        {bbox_clause}
+        """
+
+
+def _bulk_locations_query(
+    location_types: Optional[Sequence[str]],
+    bounds: Optional[BoundingBox],
+    limit: int,
+) -> Tuple[Any, ...]:
+    """SQL and parameters for the bulk (cluster layer) location query."""
+    # Select only essential fields for performance; bounds filter is
+    # applied at database level against the GiST index on geom
+    params: List[Any] = [location_types or None, limit]
+    bbox_clause = ""
+    if bounds:
+        bbox_clause = "AND geom && ST_MakeEnvelope($3, $4, $5, $6, 4326)"
+        params.extend(bounds.to_envelope_params())
+
+    # Defaults, text ids and float coordinates are produced in SQL so
+    # each row maps straight onto the response without Decimal/UUID
+    # conversion in Python
+    sql = f"""
+        SELECT
+            id::text AS id,
+            COALESCE(name_modern, 'Unknown') AS name,
+            ST_X(geom) AS lng,
+            ST_Y(geom) AS lat,
+            COALESCE(location_type, 'unknown') AS type
+        FROM locations
+        WHERE deleted_at IS NULL
+          AND geom IS NOT NULL
+          AND ($1::text[] IS NULL OR location_type = ANY($1))
+          {bbox_clause}
+        LIMIT $2
+        """
+    return (sql, *params)
 
 
 class MapService:
     """Service for map-related data operations."""
 
-    def __init__(self, db: Client):
+    def __init__(self, db: asyncpg.Connection):
         self.db = db
 
     async def get_factoids_for_map(
         self,
-        layers: Optional[List[str]] = None,
-        categories: Optional[List[str]] = None,
+        layers: Optional[Sequence[str]] = None,
+        categories: Optional[Sequence[str]] = None,
         bounds: Optional[BoundingBox] = None,
         frame_id: Optional[UUID] = None,
         limit: int = 500,
@@ -40,98 +146,58 @@ class MapService:
         Returns:
             List of factoids with location data formatted for map display
         """
-        # Build query for factoids with locations
-        query = self.db.table("factoids").select(
-            """
-            id,
-            summary,
-            description,
-            layer,
-            factoid_type,
-            community_confidence,
-            factoid_locations!inner (
-                relationship,
-                location:locations (
-                    id,
-                    name_modern,
-                    name_historical,
-                    coordinate_x,
-                    coordinate_y,
-                    location_type,
-                    location_subtype,
-                    uncertainty_radius_km
-                )
-            )
-            """
-        ).is_("deleted_at", "null")
-
-        # Apply layer filter
+        # Only the filters actually given become SQL; each filter shape gets
+        # its own statement text so Postgres plans it with the right indexes
+        params: List[Any] = [limit]
         if layers:
-            query = query.in_("layer", layers)
-
-        # Apply category filter
+            params.append(layers)
         if categories:
-            query = query.in_("factoid_type", categories)
-
-        # Apply limit
-        query = query.limit(limit)
+            params.append(categories)
+        if bounds:
+            params.extend(bounds.to_envelope_params())
 
-        result = query.execute()
+        rows = await self.db.fetch(
+            _factoid_sql(bool(layers), bool(categories), bool(bounds)),
+            *params,
+        )
 
         # Transform to map format
         map_factoids = []
-        for factoid in result.data or []:
-            # Get location from the join
-            factoid_locations = factoid.get("factoid_locations", [])
-            if not factoid_locations:
+        for row in rows:
+            # Skip if no coordinates
+            coord_x = row.get("coordinate_x")
+            coord_y = row.get("coordinate_y")
+            if coord_x is None or coord_y is None:
                 continue
 
-            for fl in factoid_locations:
-                location = fl.get("location")
-                if not location:
-                    continue
-
-                # Skip if no coordinates
-                coord_x = location.get("coordinate_x")
-                coord_y = location.get("coordinate_y")
-                if coord_x is None or coord_y is None:
-                    continue
-
-                # Apply bounds filter (post-query for simplicity)
-                if bounds and not bounds.contains(float(coord_x), float(coord_y)):
-                    continue
-
-                # Get historical name for display period (if any)
-                historical_names = location.get("name_historical", [])
-                name_historical = None
-                if historical_names and len(historical_names) > 0:
-                    # Just use first historical name for now
-                    name_historical = historical_names[0].get("name") if isinstance(historical_names[0], dict) else historical_names[0]
-
-                map_factoid = {
-                    "id": factoid["id"],
-                    "summary": factoid.get("summary") or factoid.get("description", "")[:100],
-                    "description": factoid.get("description"),
-                    "layer": factoid.get("layer", "attested"),
-                    "confidence": float(factoid.get("community_confidence", 0)) if factoid.get("community_confidence") else None,
-                    "category": factoid.get("factoid_type"),
-                    "location": {
-                        "id": location["id"],
-                        "name": location.get("name_modern") or "Unknown",
-                        "nameHistorical": name_historical,
-                        "coordinates": [float(coord_x), float(coord_y)],
-                        "uncertaintyRadiusKm": float(location.get("uncertainty_radius_km", 0)) if location.get("uncertainty_radius_km") else None,
-                        "locationType": location.get("location_type", "point"),
-                        "locationSubtype": location.get("location_subtype"),
-                    }
+            # Get historical name for display period (if any); just use
+            # the first historical name for now
+            name_historical = _first_historical_name(row.get("name_historical"))
+
+            map_factoid = {
+                "id": str(row["id"]),
+                "summary": row.get("summary") or (row.get("description") or "")[:100],
+                "description": row.get("description"),
+                "layer": row.get("layer") or "attested",
+                "confidence": float(row["community_confidence"]) if row.get("community_confidence") else None,
+                "category": row.get("factoid_type"),
+                "location": {
+                    "id": str(row["location_id"]),
+                    "name": row.get("name_modern") or "Unknown",
+                    "nameHistorical": name_historical,
+                    "coordinates": [float(coord_x), float(coord_y)],
+                    "uncertaintyRadiusKm": float(row["uncertainty_radius_km"]) if row.get("uncertainty_radius_km") else None,
+                    "locationType": row.get("location_type") or "point",
+                    "locationSubtype": row.get("location_subtype"),
                 }
-                map_factoids.append(map_factoid)
+            }
+            map_factoids.append(map_factoid)
 
         return map_factoids
 
     async def get_journey_routes(
         self,
-        route_types: Optional[List[str]] = None,
+        route_types: Optional[Sequence[str]] = None,
         bounds: Optional[BoundingBox] = None,
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
@@ -146,30 +212,41 @@ class MapService:
         Returns:
             List of journey routes formatted for map display
         """
-        query = self.db.table("journey_routes").select(
-            """
-            id,
-            name,
-            description,
-            route_type,
-            travel_mode,
-            route_geojson,
-            color,
-            line_style,
-            start_location:start_location_id (name_modern, coordinate_x, coordinate_y),
-            end_location:end_location_id (name_modern, coordinate_x, coordinate_y),
-            waypoints
-            """
-        ).is_("deleted_at", "null")
-
-        if route_types:
-            query = query.in_("route_type", route_types)
-
-        query = query.limit(limit)
-        result = query.execute()
+        params: List[Any] = [route_types or None, limit]
+        bbox_clause = ""
+        if bounds:
+            bbox_clause = "AND r.bbox && ST_MakeEnvelope($3, $4, $5, $6, 4326)"
+            params.extend(bounds.to_envelope_params())
+
+        rows = await self.db.fetch(
+            f"""
+            SELECT
+                r.id,
+                r.name,
+                r.description,
+                r.route_type,
+                r.travel_mode,
+                r.route_geojson,
+                r.color,
+                r.line_style,
+                r.waypoints,
+                s.coordinate_x AS start_x,
+                s.coordinate_y AS start_y,
+                e.coordinate_x AS end_x,
+                e.coordinate_y AS end_y
+            FROM journey_routes r
+            LEFT JOIN locations s ON s.id = r.start_location_id
+            LEFT JOIN locations e ON e.id = r.end_location_id
+            WHERE r.deleted_at IS NULL
+              AND ($1::text[] IS NULL OR r.route_type = ANY($1))
+              {bbox_clause}
+            LIMIT $2
+            """,
+            *params,
+        )
 
         routes = []
-        for route in result.data or []:
+        for route in rows:
             # Get coordinates from route_geojson or build from waypoints
             coordinates = []
 
@@ -180,39 +257,35 @@ class MapService:
                     coordinates = geojson["coordinates"]
             else:
                 # Build from start/end/waypoints
-                if route.get("start_location"):
-                    start = route["start_location"]
-                    if start.get("coordinate_x") and start.get("coordinate_y"):
-                        coordinates.append([
-                            float(start["coordinate_x"]),
-                            float(start["coordinate_y"])
-                        ])
+                if route.get("start_x") and route.get("start_y"):
+                    coordinates.append([
+                        float(route["start_x"]),
+                        float(route["start_y"])
+                    ])
 
                 # Add waypoints
-                waypoints = route.get("waypoints", [])
+                waypoints = route.get("waypoints") or []
                 for wp in waypoints:
                     if isinstance(wp, dict) and "coordinates" in wp:
                         coordinates.append(wp["coordinates"])
 
-                if route.get("end_location"):
-                    end = route["end_location"]
-                    if end.get("coordinate_x") and end.get("coordinate_y"):
-                        coordinates.append([
-                            float(end["coordinate_x"]),
-                            float(end["coordinate_y"])
-                        ])
+                if route.get("end_x") and route.get("end_y"):
+                    coordinates.append([
+                        float(route["end_x"]),
+                        float(route["end_y"])
+                    ])
 
             if len(coordinates) < 2:
                 continue  # Need at least 2 points for a route
 
             routes.append({
-                "id": route["id"],
-                "name": route.get("name", "Unnamed Route"),
+                "id": str(route["id"]),
+                "name": route.get("name") or "Unnamed Route",
                 "description": route.get("description"),
-                "routeType": route.get("route_type", "travel"),
+                "routeType": route.get("route_type") or "travel",
                 "coordinates": coordinates,
                 "color": route.get("color"),
-                "lineStyle": route.get("line_style", "solid"),
+                "lineStyle": route.get("line_style") or "solid",
             })
 
         return routes
@@ -232,46 +305,57 @@ class MapService:
         Returns:
             List of historical map overlays formatted for map display
         """
-        query = self.db.table("historical_maps").select(
-            """
-            id,
-            name,
-            description,
-            tile_url_template,
-            bounds_sw_x,
-            bounds_sw_y,
-            bounds_ne_x,
-            bounds_ne_y,
-            min_zoom,
-            max_zoom,
-            is_georeferenced
-            """
-        ).is_("deleted_at", "null").eq("is_georeferenced", True)
-
-        query = query.limit(limit)
-        result = query.execute()
+        # Maps without known bounds cover the whole world
+        params: List[Any] = [limit]
+        bbox_clause = ""
+        if bounds:
+            bbox_clause = "AND (bbox IS NULL OR bbox && ST_MakeEnvelope($2, $3, $4, $5, 4326))"
+            params.extend(bounds.to_envelope_params())
+
+        rows = await self.db.fetch(
+            f"""
+            SELECT
+                id,
+                name,
+                description,
+                tile_url_template,
+                bounds_sw_x,
+                bounds_sw_y,
+                bounds_ne_x,
+                bounds_ne_y,
+                min_zoom,
+                max_zoom,
+                is_georeferenced
+            FROM historical_maps
+            WHERE deleted_at IS NULL
+              AND is_georeferenced = TRUE
+              {bbox_clause}
+            LIMIT $1
+            """,
+            *params,
+        )
 
         overlays = []
-        for overlay in result.data or []:
+        for overlay in rows:
             if not overlay.get("tile_url_template"):
                 continue
 
             overlays.append({
-                "id": overlay["id"],
-                "name": overlay.get("name", "Historical Map"),
+                "id": str(overlay["id"]),
+                "name": overlay.get("name") or "Historical Map",
                 "tileUrl": overlay["tile_url_template"],
                 "bounds": [
                     [
-                        float(overlay.get("bounds_sw_x", -180)),
-                        float(overlay.get("bounds_sw_y", -90))
+                        float(overlay.get("bounds_sw_x") or -180),
+                        float(overlay.get("bounds_sw_y") or -90)
                     ],
                     [
-                        float(overlay.get("bounds_ne_x", 180)),
-                        float(overlay.get("bounds_ne_y", 90))
+                        float(overlay.get("bounds_ne_x") or 180),
+                        float(overlay.get("bounds_ne_y") or 90)
                     ]
                 ],
-                "minZoom": overlay.get("min_zoom", 0),
-                "maxZoom": overlay.get("max_zoom", 18),
+                "minZoom": overlay.get("min_zoom") or 0,
+                "maxZoom": overlay.get("max_zoom") or 18,
                 "opacity": 0.7,  # Default opacity
             })
 
@@ -297,47 +381,52 @@ class MapService:
         Returns:
             List of matching locations with distance if center provided
         """
-        # Text search on location names
-        db_query = self.db.table("locations").select(
+        # Text search on location names (fetch extra for filtering)
+        rows = await self.db.fetch(
             """
-            id,
-            name_modern,
-            name_historical,
-            coordinate_x,
-            coordinate_y,
-            location_type,
-            location_subtype,
-            uncertainty_radius_km
-            """
-        ).is_("deleted_at", "null").ilike("name_modern", f"%{query}%")
-
-        db_query = db_query.limit(limit * 2)  # Fetch extra for filtering
-        result = db_query.execute()
+            SELECT
+                id,
+                name_modern,
+                name_historical,
+                ST_X(geom) AS lng,
+                ST_Y(geom) AS lat,
+                location_type,
+                location_subtype,
+                uncertainty_radius_km
+            FROM locations
+            WHERE deleted_at IS NULL
+              AND geom IS NOT NULL
+              AND name_modern ILIKE $1
+            LIMIT $2
+            """,
+            f"%{query}%",
+            limit * 2,
+        )
+
+        # Distances for all matches in one vectorized pass
+        distances = None
+        if rows and center_lng is not None and center_lat is not None:
+            distances = distances_km(
+                np.fromiter((r["lng"] for r in rows), dtype=np.float64, count=len(rows)),
+                np.fromiter((r["lat"] for r in rows), dtype=np.float64, count=len(rows)),
+                center_lng, center_lat,
+            )
 
         locations = []
-        for loc in result.data or []:
-            coord_x = loc.get("coordinate_x")
-            coord_y = loc.get("coordinate_y")
-
-            if coord_x is None or coord_y is None:
-                continue
-
+        for i, loc in enumerate(rows):
             distance = None
-            if center_lng is not None and center_lat is not None:
-                distance = calculate_distance(
-                    center_lng, center_lat,
-                    float(coord_x), float(coord_y)
-                )
+            if distances is not None:
+                distance = float(distances[i])
                 # Filter by radius
                 if radius_km and distance > radius_km:
                     continue
 
             locations.append({
-                "id": loc["id"],
+                "id": str(loc["id"]),
                 "name": loc.get("name_modern") or "Unknown",
-                "nameHistorical": loc.get("name_historical"),
-                "coordinates": [float(coord_x), float(coord_y)],
-                "locationType": loc.get("location_type", "point"),
+                "nameHistorical": _first_historical_name(loc.get("name_historical")),
+                "coordinates": [loc["lng"], loc["lat"]],
+                "locationType": loc.get("location_type") or "point",
                 "locationSubtype": loc.get("location_subtype"),
                 "uncertaintyRadiusKm": float(loc.get("uncertainty_radius_km", 0)) if loc.get("uncertainty_radius_km") else None,
                 "distanceKm": round(distance, 2) if distance else None,
@@ -372,62 +461,54 @@ class MapService:
         # Get bounding box for initial filter
         bounds = expand_bounds(center_lng, center_lat, radius_km)
 
-        # Query locations within bounding box
-        query = self.db.table("locations").select(
-            """
-            id,
-            name_modern,
-            name_historical,
-            coordinate_x,
-            coordinate_y,
-            location_type,
-            location_subtype,
-            uncertainty_radius_km
+        # Query locations within the rough bounding box (GiST index on geom)
+        rows = await self.db.fetch(
             """
-        ).is_("deleted_at", "null")
+            SELECT
+                id,
+                name_modern,
+                name_historical,
+                ST_X(geom) AS lng,
+                ST_Y(geom) AS lat,
+                location_type,
+                location_subtype,
+                uncertainty_radius_km
+            FROM locations
+            WHERE deleted_at IS NULL
+              AND geom && ST_MakeEnvelope($1, $2, $3, $4, 4326)
+            """,
+            *bounds.to_envelope_params(),
+        )
+        if not rows:
+            return []
+
+        # Filter by precise distance over all candidates at once
+        lng = np.fromiter((r["lng"] for r in rows), dtype=np.float64, count=len(rows))
+        lat = np.fromiter((r["lat"] for r in rows), dtype=np.float64, count=len(rows))
+        distances = distances_km(lng, lat, center_lng, center_lat, model=model)
+
+        # Nearest first, and only build response dicts for the rows we return
+        within = np.flatnonzero(distances <= radius_km)
+        nearest = within[np.argsort(distances[within], kind="stable")][:limit]
 
-        # Apply rough bounding box filter
-        query = query.gte("coordinate_x", bounds.sw_lng)
-        query = query.lte("coordinate_x", bounds.ne_lng)
-        query = query.gte("coordinate_y", bounds.sw_lat)
-        query = query.lte("coordinate_y", bounds.ne_lat)
-
-        result = query.execute()
-
-        # Filter by precise distance
         locations = []
-        for loc in result.data or []:
-            coord_x = loc.get("coordinate_x")
-            coord_y = loc.get("coordinate_y")
-
-            if coord_x is None or coord_y is None:
-                continue
-
-            distance = calculate_distance(
-                center_lng, center_lat,
-                float(coord_x), float(coord_y),
-                model=model
-            )
-
-            if distance <= radius_km:
-                locations.append({
-                    "id": loc["id"],
-                    "name": loc.get("name_modern") or "Unknown",
-                    "nameHistorical": loc.get("name_historical"),
-                    "coordinates": [float(coord_x), float(coord_y)],
-                    "locationType": loc.get("location_type", "point"),
-                    "uncertaintyRadiusKm": float(loc.get("uncertainty_radius_km", 0)) if loc.get("uncertainty_radius_km") else None,
-                    "distanceKm": round(distance, 2),
-                })
-
-        # Sort by distance
-        locations.sort(key=lambda x: x["distanceKm"])
+        for i in nearest:
+            loc = rows[i]
+            locations.append({
+                "id": str(loc["id"]),
+                "name": loc.get("name_modern") or "Unknown",
+                "nameHistorical": _first_historical_name(loc.get("name_historical")),
+                "coordinates": [lng[i].item(), lat[i].item()],
+                "locationType": loc.get("location_type") or "point",
+                "uncertaintyRadiusKm": float(loc["uncertainty_radius_km"]) if loc.get("uncertainty_radius_km") else None,
+                "distanceKm": round(distances[i].item(), 2),
+            })
 
-        return locations[:limit]
+        return locations
 
     async def get_bulk_locations(
         self,
-        location_types: Optional[List[str]] = None,
+        location_types: Optional[Sequence[str]] = None,
         bounds: Optional[BoundingBox] = None,
         limit: int = 50000,
     ) -> List[Dict[str, Any]]:
@@ -444,49 +525,36 @@ class MapService:
         Returns:
             List of simplified locations for cluster rendering
         """
-        # Select only essential fields for performance
-        query = self.db.table("locations").select(
-            """
-            id,
-            name_modern,
-            coordinate_x,
-            coordinate_y,
-            location_type
-            """
-        ).is_("deleted_at", "null")
-
-        # Apply type filter
-        if location_types:
-            query = query.in_("location_type", location_types)
-
-        # Apply bounds filter at database level for efficiency
-        if bounds:
-            query = query.gte("coordinate_x", bounds.sw_lng)
-            query = query.lte("coordinate_x", bounds.ne_lng)
-            query = query.gte("coordinate_y", bounds.sw_lat)
-            query = query.lte("coordinate_y", bounds.ne_lat)
-
-        # Ensure we only get locations with coordinates
-        query = query.not_.is_("coordinate_x", "null")
-        query = query.not_.is_("coordinate_y", "null")
-
-        query = query.limit(limit)
-        result = query.execute()
+        rows = await self.db.fetch(*_bulk_locations_query(location_types, bounds, limit))
 
         # Transform to minimal format
-        locations = []
-        for loc in result.data or []:
-            coord_x = loc.get("coordinate_x")
-            coord_y = loc.get("coordinate_y")
-
-            if coord_x is None or coord_y is None:
-                continue
-
-            locations.append({
-                "id": loc["id"],
-                "name": loc.get("name_modern") or "Unknown",
-                "coordinates": [float(coord_x), float(coord_y)],
-                "type": loc.get("location_type", "unknown"),
-            })
+        locations = [
+            {"id": id_, "name": name, "coordinates": [lng, lat], "type": type_}
+            for id_, name, lng, lat, type_ in rows
+        ]
 
         return locations
+
+    async def stream_bulk_locations(
+        self,
+        location_types: Optional[Sequence[str]] = None,
+        bounds: Optional[BoundingBox] = None,
+        limit: int = 50000,
+        batch_size: int = 1024,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Same rows as get_bulk_locations, yielded in batches from a server-side
+        cursor so the full result is never held in memory at once.
+        """
+        sql, *params = _bulk_locations_query(location_types, bounds, limit)
+
+        # asyncpg cursors only exist inside a transaction
+        async with self.db.transaction():
+            batch = []
+            async for id_, name, lng, lat, type_ in self.db.cursor(sql, *params, prefetch=batch_size):
+                batch.append({"id": id_, "name": name, "coordinates": [lng, lat], "type": type_})
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
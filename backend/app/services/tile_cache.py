@@ -0,0 +1,188 @@
+"""
+Viewport tile cache for map endpoints.
+
+Request bounds are snapped outward to a fixed tile grid, so small pans
+inside the same tiles resolve to the same Redis key and skip the
+database. Only complete tile ranges (fewer rows than the limit) are
+stored, and rows are filtered back to the requested viewport on the way
+out. Cached entries expire after a few minutes and are cleared when an
+ingestor writes new map data.
+"""
+import hashlib
+import logging
+import math
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+import orjson
+
+from app.core.redis_client import get_redis
+from app.services.geo_service import BoundingBox
+
+logger = logging.getLogger(__name__)
+
+# Grid resolution: 360 / 2**8 = ~1.4 degrees per tile
+CACHE_ZOOM = 8
+CACHE_TTL_SECONDS = 300
+KEY_PREFIX = "map"
+# Bumped whenever map data changes; feeds HTTP ETags on map endpoints
+LAST_INGEST_KEY = "ingest:last_ts"
+
+
+@lru_cache(maxsize=1024)
+def tile_range(bounds: BoundingBox, zoom: int = CACHE_ZOOM) -> Tuple[int, int, int, int]:
+    """
+    Tile indices covering the bounds, as (x0, y0, x1, y1).
+
+    Tiles are a plain lng/lat degree grid; x1/y1 are exclusive.
+    Memoized on the (hashable) bounds since snapped viewports repeat.
+    """
+    step = 360.0 / (1 << zoom)
+    x0 = math.floor((bounds.sw_lng + 180) / step)
+    y0 = math.floor((bounds.sw_lat + 90) / step)
+    x1 = max(math.ceil((bounds.ne_lng + 180) / step), x0 + 1)
+    y1 = max(math.ceil((bounds.ne_lat + 90) / step), y0 + 1)
+    return x0, y0, x1, y1
+
+
+def snap_bounds(bounds: BoundingBox, zoom: int = CACHE_ZOOM) -> BoundingBox:
+    """Expand bounds outward to the edges of the tiles they touch."""
+    step = 360.0 / (1 << zoom)
+    x0, y0, x1, y1 = tile_range(bounds, zoom)
+    return BoundingBox(
+        sw_lng=x0 * step - 180,
+        sw_lat=y0 * step - 90,
+        ne_lng=x1 * step - 180,
+        ne_lat=y1 * step - 90,
+    )
+
+
+def cache_key(layer: str, bounds: Optional[BoundingBox], params: dict) -> str:
+    """Build the Redis key for a layer, tile range and remaining query params."""
+    tiles = "all"
+    if bounds is not None:
+        tiles = ":".join(str(t) for t in tile_range(bounds))
+    params_hash = hashlib.blake2b(
+        orjson.dumps(params, option=orjson.OPT_SORT_KEYS), digest_size=8
+    ).hexdigest()
+    return f"{KEY_PREFIX}:{layer}:{CACHE_ZOOM}:{tiles}:{params_hash}"
+
+
+def point_in_bounds(item: dict, bounds: BoundingBox) -> bool:
+    """Viewport filter for rows with a [lng, lat] "coordinates" point."""
+    return bounds.contains(*item["coordinates"])
+
+
+def factoid_in_bounds(item: dict, bounds: BoundingBox) -> bool:
+    """Viewport filter for map factoids (point under "location")."""
+    return point_in_bounds(item["location"], bounds)
+
+
+def route_in_bounds(item: dict, bounds: BoundingBox) -> bool:
+    """Viewport filter for routes: the route's bbox overlaps the viewport."""
+    lngs = [c[0] for c in item["coordinates"]]
+    lats = [c[1] for c in item["coordinates"]]
+    return bounds.intersects(BoundingBox(min(lngs), min(lats), max(lngs), max(lats)))
+
+
+def overlay_in_bounds(item: dict, bounds: BoundingBox) -> bool:
+    """Viewport filter for overlays with [[sw_lng, sw_lat], [ne_lng, ne_lat]] bounds."""
+    (sw_lng, sw_lat), (ne_lng, ne_lat) = item["bounds"]
+    return bounds.intersects(BoundingBox(sw_lng, sw_lat, ne_lng, ne_lat))
+
+
+async def cached_fetch(
+    layer: str,
+    bounds: Optional[BoundingBox],
+    limit: int,
+    fetch: Callable[[Optional[BoundingBox]], Awaitable[List[Any]]],
+    in_bounds: Callable[[Any, BoundingBox], bool],
+    cacheable: bool = True,
+) -> List[Any]:
+    """
+    Return map rows for the requested bounds, from Redis when possible.
+
+    The fetch runs against the tile-snapped bounds and the rows are then
+    filtered back to the requested viewport. A tile range is only stored
+    when it came back with fewer than `limit` rows: a full result may
+    have spent the limit outside the viewport, so that request falls
+    back to fetching the exact bounds instead.
+
+    Args:
+        layer: Endpoint/layer name used in the key (factoids, routes, ...)
+        bounds: Requested viewport, or None for an unbounded query
+        limit: Row limit the fetch applies; also part of the key
+        fetch: Loads the rows for the given bounds
+        in_bounds: Whether a row belongs to a viewport, matching the
+            SQL bbox filter for the layer
+        cacheable: False to bypass the cache, e.g. for filtered requests
+            whose combinations would make the key space unbounded
+
+    Redis errors are logged and fall through to fetch().
+    """
+    if not cacheable:
+        return await fetch(bounds)
+
+    snapped = snap_bounds(bounds) if bounds is not None else None
+    key = cache_key(layer, snapped, {"limit": limit})
+    redis = get_redis()
+
+    def clip(rows: List[Any]) -> List[Any]:
+        if bounds is None or bounds == snapped:
+            return rows
+        return [row for row in rows if in_bounds(row, bounds)]
+
+    try:
+        hit = await redis.get(key)
+        if hit is not None:
+            return clip(orjson.loads(hit))
+    except Exception as e:
+        logger.warning(f"Map cache read failed for {key}: {e}")
+
+    data = await fetch(snapped)
+
+    if len(data) >= limit:
+        # Truncated; the exact-bounds query is the only correct answer
+        if bounds is None or bounds == snapped:
+            return data
+        return await fetch(bounds)
+
+    try:
+        await redis.set(key, orjson.dumps(data), ex=CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Map cache write failed for {key}: {e}")
+
+    return clip(data)
+
+
+async def get_last_ingest_ts() -> Optional[str]:
+    """
+    Timestamp of the last map data change, "0" if none was recorded, or
+    None if Redis can't be read (an ingest may then have gone unseen).
+    """
+    try:
+        ts = await get_redis().get(LAST_INGEST_KEY)
+    except Exception as e:
+        logger.warning(f"Could not read {LAST_INGEST_KEY}: {e}")
+        return None
+    return ts.decode() if ts is not None else "0"
+
+
+async def invalidate_map_cache(batch_size: int = 500) -> int:
+    """
+    Delete all cached map tiles and bump the last-ingest timestamp.
+    Returns the number of keys removed.
+    """
+    redis = get_redis()
+    await redis.set(LAST_INGEST_KEY, repr(time.time()))
+    deleted = 0
+    batch = []
+    async for key in redis.scan_iter(match=f"{KEY_PREFIX}:*", count=batch_size):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            deleted += await redis.unlink(*batch)
+            batch = []
+    if batch:
+        deleted += await redis.unlink(*batch)
+    return deleted
@@ -0,0 +1,21 @@
+-- Migration: 007_postgis_spatial_index.sql
+-- PostGIS point geometry for locations
+--
+-- Map viewport queries filter with `geom && ST_MakeEnvelope(...)`, which
+-- uses a GiST index instead of four scalar range comparisons on
+-- coordinate_x / coordinate_y.
+
+CREATE EXTENSION IF NOT EXISTS postgis;
+
+-- ============================================
+-- LOCATIONS: POINT GEOMETRY
+-- ============================================
+
+-- Derived from coordinate_x/coordinate_y so ingestors don't need to change.
+-- NULL when either coordinate is missing (ST_MakePoint is strict).
+ALTER TABLE locations ADD COLUMN IF NOT EXISTS geom geometry(Point, 4326)
+    GENERATED ALWAYS AS (
+        ST_SetSRID(ST_MakePoint(coordinate_x::float8, coordinate_y::float8), 4326)
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_locations_geom ON locations USING gist(geom);
@@ -0,0 +1,68 @@
+-- Migration: 008_route_overlay_bbox.sql
+-- Materialized bounding boxes for journey routes and historical maps
+--
+-- Viewport queries filter with `bbox && ST_MakeEnvelope(...)` against a
+-- GiST index rather than computing an envelope per row at query time.
+-- Requires 007_postgis_spatial_index.sql.
+
+-- ============================================
+-- JOURNEY ROUTES
+-- ============================================
+
+ALTER TABLE journey_routes ADD COLUMN IF NOT EXISTS bbox geometry(Geometry, 4326);
+
+-- Envelope of route_geojson when present, otherwise of the start/end
+-- locations plus any waypoint coordinates (mirrors how the API builds
+-- the rendered line).
+CREATE OR REPLACE FUNCTION journey_routes_set_bbox()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.route_geojson IS NOT NULL THEN
+        NEW.bbox := ST_Envelope(
+            ST_SetSRID(ST_GeomFromGeoJSON(NEW.route_geojson::text), 4326)
+        );
+    ELSE
+        SELECT ST_Envelope(ST_Collect(pts.pt)) INTO NEW.bbox
+        FROM (
+            SELECT l.geom AS pt
+            FROM locations l
+            WHERE l.id IN (NEW.start_location_id, NEW.end_location_id)
+            UNION ALL
+            SELECT ST_SetSRID(ST_MakePoint(
+                (wp->'coordinates'->>0)::float8,
+                (wp->'coordinates'->>1)::float8
+            ), 4326)
+            FROM jsonb_array_elements(COALESCE(NEW.waypoints, '[]'::jsonb)) wp
+            WHERE wp ? 'coordinates'
+        ) pts;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Dropped first so the migration can be re-run
+DROP TRIGGER IF EXISTS set_journey_routes_bbox ON journey_routes;
+CREATE TRIGGER set_journey_routes_bbox
+    BEFORE INSERT OR UPDATE ON journey_routes
+    FOR EACH ROW EXECUTE FUNCTION journey_routes_set_bbox();
+
+-- Backfill existing rows (fires the trigger)
+UPDATE journey_routes SET route_geojson = route_geojson;
+
+CREATE INDEX IF NOT EXISTS idx_journey_routes_bbox ON journey_routes USING gist(bbox);
+
+-- ============================================
+-- HISTORICAL MAPS
+-- ============================================
+
+-- NULL when bounds are unknown; the API treats those as world-wide
+ALTER TABLE historical_maps ADD COLUMN IF NOT EXISTS bbox geometry(Polygon, 4326)
+    GENERATED ALWAYS AS (
+        ST_MakeEnvelope(
+            bounds_sw_x::float8, bounds_sw_y::float8,
+            bounds_ne_x::float8, bounds_ne_y::float8,
+            4326
+        )
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_hist_maps_bbox ON historical_maps USING gist(bbox);
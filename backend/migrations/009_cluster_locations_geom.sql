@@ -0,0 +1,15 @@
+-- Migration: 009_cluster_locations_geom.sql
+-- Physically order locations by their GiST (R-tree) index
+--
+-- /map/locations can return up to 100k points per viewport. CLUSTER
+-- rewrites the table in spatial index order so points that are close on
+-- the map are close on disk, and a viewport scan touches far fewer heap
+-- pages. Requires 007_postgis_spatial_index.sql.
+--
+-- CLUSTER is a one-off rewrite (takes an ACCESS EXCLUSIVE lock) and is
+-- not maintained for new rows. Re-run after large ingests, e.g.:
+--   CLUSTER locations;  -- reuses the index recorded below
+--   ANALYZE locations;
+
+CLUSTER locations USING idx_locations_geom;
+ANALYZE locations;
@@ -0,0 +1,30 @@
+-- Migration: 010_ingest_unique_keys.sql
+-- Keys for ingest deduplication
+--
+-- Ingestors skip actors and sources that already exist by probing these
+-- indexes instead of scanning the tables. Sources are unique per digital
+-- URL; ingestors already deduplicated on it, so existing data should not
+-- violate it; check with the query below before running if unsure:
+--   SELECT digital_url FROM sources GROUP BY 1 HAVING count(*) > 1;
+
+-- ============================================
+-- ACTORS: LOOKUP BY PRIMARY NAME
+-- ============================================
+
+-- Not unique: distinct people can share a name, so the database doesn't
+-- forbid it (ingestors reuse a live actor of the same name by choice).
+-- Soft-deleted rows are left out, as ingestors never match them.
+-- (Replaces the table-wide unique index an earlier version created.)
+DROP INDEX IF EXISTS idx_actors_name_primary_unique;
+
+CREATE INDEX IF NOT EXISTS idx_actors_name_primary
+    ON actors(name_primary)
+    WHERE deleted_at IS NULL;
+
+-- ============================================
+-- SOURCES: ONE ROW PER DIGITAL URL
+-- ============================================
+
+-- NULLs stay distinct, so sources without a URL are unaffected
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sources_digital_url_unique
+    ON sources(digital_url);
@@ -0,0 +1,40 @@
+-- Migration: 011_locations_external_id.sql
+-- Dedicated external id column for locations
+--
+-- Ingestors used to find an existing location by searching name_historical
+-- for its external id (e.g. "pleiades:579885") with a jsonb containment
+-- check. A plain TEXT column with a partial unique btree index turns that
+-- into an equality probe and makes duplicates impossible.
+--
+-- Existing rows are backfilled from the "source:id" strings ingestors kept
+-- in name_historical (the oldest live row wins if there are duplicates).
+
+ALTER TABLE locations ADD COLUMN IF NOT EXISTS external_id TEXT;
+
+-- ============================================
+-- BACKFILL FROM name_historical
+-- ============================================
+
+WITH ids AS (
+    SELECT DISTINCT ON (e.value) l.id, e.value AS external_id
+    FROM locations l
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(l.name_historical) = 'array' THEN l.name_historical ELSE '[]' END
+    ) AS e(value)
+    WHERE l.external_id IS NULL
+      AND l.deleted_at IS NULL
+      AND e.value ~ '^[a-z]+:[^[:space:]:]+$'
+    ORDER BY e.value, l.created_at
+)
+UPDATE locations l
+SET external_id = ids.external_id
+FROM ids
+WHERE l.id = ids.id;
+
+-- ============================================
+-- ONE LIVE ROW PER EXTERNAL ID
+-- ============================================
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_locations_external_id_unique
+    ON locations(external_id)
+    WHERE external_id IS NOT NULL AND deleted_at IS NULL;
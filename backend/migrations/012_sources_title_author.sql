@@ -0,0 +1,11 @@
+-- Migration: 012_sources_title_author.sql
+-- Index the title + author match used to dedup sources without a URL
+--
+-- Ingestors skip a buffered source that already exists: by digital_url
+-- (idx_sources_digital_url_unique), or, for sources without a URL, by
+-- title and author. Without this index every such probe is a sequential
+-- scan of sources. Rows without an author are found through the same
+-- index with `author_id IS NULL`.
+
+CREATE INDEX IF NOT EXISTS idx_sources_title_author
+    ON sources(title, author_id);
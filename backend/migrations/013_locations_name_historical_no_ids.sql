@@ -0,0 +1,13 @@
+-- Migration: 013_locations_name_historical_no_ids.sql
+-- Remove external ids from locations.name_historical
+--
+-- Ingestors used to append a location's external id (e.g.
+-- "pleiades:579885") to its historical names. Since 011 the id lives in
+-- the external_id column, and name_historical is shown to users as
+-- names, so the copies are removed. Requires 011_locations_external_id.sql.
+
+UPDATE locations
+SET name_historical = name_historical - external_id
+WHERE external_id IS NOT NULL
+  AND jsonb_typeof(name_historical) = 'array'
+  AND name_historical ? external_id;
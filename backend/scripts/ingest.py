@@ -35,6 +35,14 @@ from app.ingest import (
     InternetArchiveIngestor,
 )
 
+try:
+    # Faster event loop for the asyncpg/httpx heavy ingest; installed with
+    # uvicorn[standard], falls back to the default loop elsewhere
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -78,7 +86,10 @@ async def run_eclipses(args):
     logger.info("NASA ECLIPSES → factoids + placements")
     logger.info("═" * 50)
     ingestor = NASAEclipseIngestor(data_dir=args.data_dir)
-    stats = await ingestor.ingest(limit=args.limit)
+    stats = await ingestor.ingest(
+        limit=args.limit,
+        rebuild_indexes=getattr(args, "rebuild_indexes", False),
+    )
     print_stats(stats)
     return stats
 
@@ -230,6 +241,11 @@ Examples:
         help="Ingest NASA eclipse data → factoids + placements",
     )
     eclipse_parser.add_argument("--limit", type=int, help="Limit eclipses")
+    eclipse_parser.add_argument(
+        "--rebuild-indexes",
+        action="store_true",
+        help="Drop secondary indexes during large catalog loads, rebuild after",
+    )
 
     # Perseus
     perseus_parser = subparsers.add_parser(
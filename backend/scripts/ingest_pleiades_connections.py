@@ -18,11 +18,13 @@ import gzip
 import json
 import logging
 import sys
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from postgrest.types import ReturnMethod
 from supabase import create_client
 from tqdm import tqdm
 
@@ -36,6 +38,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ConnectionStats:
+    """Counters for one connection pass."""
+    connections_created: int = 0
+    connections_skipped_missing: int = 0
+    connections_skipped_error: int = 0
+
+
 class PleiadesConnectionIngestor:
     """Ingest connections between Pleiades locations."""
 
@@ -43,11 +53,7 @@ class PleiadesConnectionIngestor:
         self.data_dir = data_dir
         self.supabase = None
         self.location_cache: dict[str, str] = {}  # pleiades_id -> location_uuid
-        self.stats = {
-            "connections_created": 0,
-            "connections_skipped_missing": 0,
-            "connections_skipped_error": 0,
-        }
+        self.stats = ConnectionStats()
 
     async def connect(self) -> None:
         """Establish Supabase connection."""
@@ -61,33 +67,25 @@ class PleiadesConnectionIngestor:
         """
         Load all Pleiades locations from database to build the ID cache.
 
-        We look for locations where name_historical contains a pleiades:xxx entry.
+        We look for locations whose external_id is pleiades:xxx.
         """
         logger.info("Loading Pleiades locations from database...")
 
         # Fetch locations with Pleiades external IDs
-        # The external ID is stored in name_historical array
         offset = 0
         batch_size = 1000
 
         while True:
             result = self.supabase.table("locations").select(
-                "id,name_historical"
-            ).range(offset, offset + batch_size - 1).execute()
+                "id,external_id"
+            ).like("external_id", "pleiades:%").range(offset, offset + batch_size - 1).execute()
 
             if not result.data:
                 break
 
             for loc in result.data:
-                loc_id = loc["id"]
-                hist_names = loc.get("name_historical") or []
-
-                # Find pleiades:xxx in the historical names
-                for name in hist_names:
-                    if isinstance(name, str) and name.startswith("pleiades:"):
-                        pleiades_id = name.replace("pleiades:", "")
-                        self.location_cache[pleiades_id] = loc_id
-                        break
+                pleiades_id = loc["external_id"].removeprefix("pleiades:")
+                self.location_cache[pleiades_id] = loc["id"]
 
             logger.info(f"Loaded {offset + len(result.data)} locations, cache has {len(self.location_cache)} Pleiades entries")
 
@@ -225,24 +223,24 @@ class PleiadesConnectionIngestor:
 
         logger.info(f"Processing {len(all_connections)} connections...")
 
-        for from_pleiades_id, conn in tqdm(all_connections, desc="Connections"):
+        for from_pleiades_id, conn in tqdm(all_connections, desc="Connections", mininterval=0.5):
             try:
                 # Get from location
                 from_uuid = self.location_cache.get(from_pleiades_id)
                 if not from_uuid:
-                    self.stats["connections_skipped_missing"] += 1
+                    self.stats.connections_skipped_missing += 1
                     continue
 
                 # Get to location
                 connects_to = conn.get("connectsTo", "")
                 to_pleiades_id = self.extract_pleiades_id(connects_to)
                 if not to_pleiades_id:
-                    self.stats["connections_skipped_missing"] += 1
+                    self.stats.connections_skipped_missing += 1
                     continue
 
                 to_uuid = self.location_cache.get(to_pleiades_id)
                 if not to_uuid:
-                    self.stats["connections_skipped_missing"] += 1
+                    self.stats.connections_skipped_missing += 1
                     continue
 
                 # Map connection type and confidence
@@ -263,12 +261,13 @@ class PleiadesConnectionIngestor:
                 }
                 data = {k: v for k, v in data.items() if v is not None}
 
-                self.supabase.table("connections").insert(data).execute()
-                self.stats["connections_created"] += 1
+                # The new row isn't used, so don't have PostgREST send it back
+                self.supabase.table("connections").insert(data, returning=ReturnMethod.minimal).execute()
+                self.stats.connections_created += 1
 
             except Exception as e:
                 logger.error(f"Failed to create connection: {e}")
-                self.stats["connections_skipped_error"] += 1
+                self.stats.connections_skipped_error += 1
 
     async def run(self, limit: int | None = None) -> dict:
         """Run the connection ingestion."""
@@ -280,7 +279,7 @@ class PleiadesConnectionIngestor:
 
             if not self.location_cache:
                 logger.error("No Pleiades locations found in database. Run main ingestion first.")
-                return self.stats
+                return asdict(self.stats)
 
             # Load places from JSON
             json_file = self.find_json_file()
@@ -293,7 +292,7 @@ class PleiadesConnectionIngestor:
             logger.info("Connection ingestion complete!")
             logger.info(f"Stats: {self.stats}")
 
-            return self.stats
+            return asdict(self.stats)
 
         finally:
             logger.info("Done")